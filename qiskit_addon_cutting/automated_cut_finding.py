@@ -145,7 +145,7 @@ class OptimizationParameters:
     nevertheless returns the result of a greedy best first search, which gives an *upper-bound* on gamma.
     """
 
-    #: The seed to use when initializing Numpy random number generators in the best first search priority queue.
+    #: The seed to use when initializing the random number generators in the best first search priority queue.
     seed: int | None = OptimizationSettings().seed
 
     #: Maximum allowed value of gamma which, if exceeded, forces the search to terminate.
@@ -165,6 +165,9 @@ class OptimizationParameters:
 class DeviceConstraints:
     """Specify the constraints (qubits per subcircuit) that must be respected."""
 
+    # Declared by hand, as ``dataclass(slots=True)`` requires Python 3.10
+    __slots__ = ("qubits_per_subcircuit",)
+
     qubits_per_subcircuit: int
 
     def __post_init__(self):
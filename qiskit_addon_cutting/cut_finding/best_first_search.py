@@ -14,8 +14,8 @@
 from __future__ import annotations
 
 import heapq
-import numpy as np
-from typing import TYPE_CHECKING, Callable, cast, NamedTuple
+import random
+from typing import TYPE_CHECKING, Hashable, Iterable, NamedTuple
 from itertools import count
 
 from .optimization_settings import OptimizationSettings
@@ -26,6 +26,22 @@ if TYPE_CHECKING:  # pragma: no cover
     from .cut_optimization import CutOptimizationFuncArgs
 
 
+# Bit layout of the tiebreak keys used by :class:`BestFirstPriorityQueue`. The
+# sequence count occupies the low bits and is unique for any realistic search;
+# the random field holds the exact integer numerator of ``random.random()``.
+_SEQ_BITS = 40
+_RANDOM_BITS = 53
+_RANDOM_SCALE = 1 << _RANDOM_BITS
+_DEPTH_SHIFT = _SEQ_BITS + _RANDOM_BITS
+
+# put_batch() re-heapifies a bucket, rather than pushing new keys one at a time,
+# when the new keys number at least 1/_HEAPIFY_RATIO of the keys already there.
+_HEAPIFY_RATIO = 4
+
+# Placeholder for "no cost seen yet" in BestFirstSearch.optimization_pass.
+_NO_COST = object()
+
+
 class SearchStats(NamedTuple):
     """NamedTuple for collecting search statistics.
 
@@ -41,42 +57,61 @@ class SearchStats(NamedTuple):
     backjumps: int
 
 
+# Statistics of a search that has not yet visited any states. SearchStats is
+# immutable, so this single instance can be shared by every search.
+_EMPTY_STATS = SearchStats(
+    states_visited=0, next_states_generated=0, states_enqueued=0, backjumps=0
+)
+
+
 class BestFirstPriorityQueue:
     """Class that implements priority queues for best-first search.
 
     The tuples that are pushed onto the priority queues have the form:
 
-    (<cost>, <neg_search_depth>, <random_num>, <seq_count>, <search_state>),
+    (<cost>, <tiebreak_key>, <search_state>),
 
     where:
 
     <cost> (numeric or tuple) is a numeric cost or tuple of numeric
     lexically-ordered costs that are to be minimized.
 
-    <neg_search_depth> (int) is the negative of the search depth of the
-    search state represented by the tuple. Thus, if several search states
-    have identical costs, priority is given to the deepest states to
-    encourage depth-first behavior.
+    <tiebreak_key> (int) packs three fields into a single integer so that
+    ties in cost are resolved with one integer comparison. From most to
+    least significant, these are:
+
+    - the negative of the search depth of the search state. Thus, if several
+      search states have identical costs, priority is given to the deepest
+      states to encourage depth-first behavior.
 
-    <random_num> is a pseudo-random number that randomly break ties in a
-    stable manner if several search states have identical costs at identical
-    search depths.
+    - a pseudo-random number that randomly breaks ties in a stable manner
+      if several search states have identical costs at identical search depths.
 
-    <seq_count> is a sequential count of push operations that is used to
-    break further ties just in case two states with the same costs and
-    depths are somehow assigned the same pseudo-random numbers.
+    - a sequential count of push operations that is used to break further ties
+      just in case two states with the same costs and depths are somehow
+      assigned the same pseudo-random numbers.
 
     <search_state> is a state object generated by the optimization process.
     Because of the design of the tuple entries that precede it, state objects
     never get evaluated in the heap-managment comparisons that are performed
     internally by the priority-queue implementation.
+
+    Searches produce many states with identical costs, so the queue is
+    bucketed by cost: ``buckets`` maps each distinct cost to a heap of
+    <tiebreak_key> values, ``costs`` is a heap of the costs that currently
+    have non-empty buckets, and ``states`` maps each tiebreak key (which is
+    unique) to its <search_state>. Entries are therefore retrieved in exactly
+    the order given by the tuples above, while the heap operations within a
+    bucket compare plain integers rather than tuples.
     """
 
     def __init__(self, seed: int | None):
         """Assign member variables."""
-        self.random_gen: np.random.Generator = np.random.default_rng(seed)
+        self.random_gen: random.Random = random.Random(seed)
         self.unique: count[int] = count()
-        self.pqueue: list[tuple] = []
+        self.buckets: dict[Hashable, list[int]] = {}
+        self.costs: list = []
+        self.states: dict[int, DisjointSubcircuitsState] = {}
 
     def put(
         self,
@@ -88,10 +123,58 @@ class BestFirstPriorityQueue:
 
         The search depth and cost of the state must also be provided as input.
         """
-        heapq.heappush(
-            self.pqueue,
-            (cost, (-depth), self.random_gen.random(), next(self.unique), state),
+        tiebreak_key = (
+            (-depth) << _DEPTH_SHIFT
+            | int(self.random_gen.random() * _RANDOM_SCALE) << _SEQ_BITS
+            | next(self.unique)
         )
+        bucket = self.buckets.get(cost)
+        if bucket is None:
+            bucket = self.buckets[cost] = []
+            heapq.heappush(self.costs, cost)
+        heapq.heappush(bucket, tiebreak_key)
+        self.states[tiebreak_key] = state
+
+    def put_batch(
+        self,
+        states: list[DisjointSubcircuitsState],
+        depth: int,
+        costs: list[float | tuple[float, float]],
+    ) -> None:
+        """Push a list of states of the same search depth, with their corresponding costs, onto the priority queue.
+
+        The result is the same as calling :meth:`put` on each state in turn, but
+        the new entries of a bucket are added with a single heapify when they are
+        numerous compared to the entries already there.
+        """
+        random_gen_random = self.random_gen.random
+        unique = self.unique
+        depth_bits = (-depth) << _DEPTH_SHIFT
+        new_keys: dict[float | tuple[float, float], list[int]] = {}
+        for state, cost in zip(states, costs):
+            tiebreak_key = (
+                depth_bits
+                | int(random_gen_random() * _RANDOM_SCALE) << _SEQ_BITS
+                | next(unique)
+            )
+            keys = new_keys.get(cost)
+            if keys is None:
+                keys = new_keys[cost] = []
+            keys.append(tiebreak_key)
+            self.states[tiebreak_key] = state
+
+        for cost, keys in new_keys.items():
+            bucket = self.buckets.get(cost)
+            if bucket is None:
+                heapq.heapify(keys)
+                self.buckets[cost] = keys
+                heapq.heappush(self.costs, cost)
+            elif len(keys) * _HEAPIFY_RATIO >= len(bucket):
+                bucket.extend(keys)
+                heapq.heapify(bucket)
+            else:
+                for tiebreak_key in keys:
+                    heapq.heappush(bucket, tiebreak_key)
 
     def get(
         self,
@@ -100,20 +183,28 @@ class BestFirstPriorityQueue:
 
         None, None, None is returned if the priority queue is empty.
         """
-        if self.qsize() == 0:  # pragma: no cover
+        if not self.states:  # pragma: no cover
             return None, None, None
 
-        best: tuple = heapq.heappop(self.pqueue)
+        cost = self.costs[0]
+        bucket = self.buckets[cost]
+        tiebreak_key = heapq.heappop(bucket)
+        state = self.states.pop(tiebreak_key)
+        if not bucket:
+            del self.buckets[cost]
+            heapq.heappop(self.costs)
 
-        return best[-1], (-best[1]), best[0]
+        return state, -(tiebreak_key >> _DEPTH_SHIFT), cost
 
     def qsize(self) -> int:
         """Return the size of the priority queue."""
-        return len(self.pqueue)
+        return len(self.states)
 
     def clear(self) -> None:
         """Clear all entries in the priority queue."""
-        self.pqueue.clear()
+        self.buckets.clear()
+        self.costs.clear()
+        self.states.clear()
 
 
 class BestFirstSearch:
@@ -130,7 +221,7 @@ class BestFirstSearch:
 
     Member Variables:
 
-    ``seed`` (int) is the seed to use when initializing Numpy random number
+    ``seed`` (int) is the seed to use when initializing the random number
     generators in :class:`BestFirstPriorityQueue` instances.
 
     ``cost_func`` is a function that computes cost values from search states.
@@ -138,6 +229,10 @@ class BestFirstSearch:
     to the ``cost_func``. The cost returned can be numeric or tuples of numerics.
     In the latter case, lexicographical comparisons are performed per Python semantics.
 
+    ``cost_func_batch`` can either be None or a function that computes the
+    costs of a whole list of next-states at once, returning None in place of
+    any cost that exceeds the upper-bound cost passed to it.
+
     ``next_state_func`` is a function that returns a list
     of next states generated from the input state. Input arguments to
     to :meth:`BestFirstSearch.optimization_pass` are also passed to
@@ -216,6 +311,7 @@ class BestFirstSearch:
         """
         self.seed = optimization_settings.get_seed
         self.cost_func = search_functions.cost_func
+        self.cost_func_batch = search_functions.cost_func_batch
         self.next_state_func = search_functions.next_state_func
         self.goal_state_func = search_functions.goal_state_func
         self.upperbound_cost_func = search_functions.upperbound_cost_func
@@ -246,7 +342,7 @@ class BestFirstSearch:
         self.num_next_states = 0
         self.num_enqueues = 0
         self.num_backjumps = 0
-        self.penultimate_stats = self.get_stats()
+        self.penultimate_stats = _EMPTY_STATS
         self.put(initial_state_list, 0, args)
 
     def optimization_pass(
@@ -274,38 +370,60 @@ class BestFirstSearch:
         if self.mincost_bound_func is not None:
             self.mincost_bound = self.mincost_bound_func(*args)  # type: ignore
 
+        pqueue = self.pqueue
+        pqueue_get = pqueue.get
+        pqueue_qsize = pqueue.qsize
+        goal_state_func = self.goal_state_func
+        next_state_func = self.next_state_func
+        assert goal_state_func is not None and next_state_func is not None
+        stop_at_first_min = self.stop_at_first_min
+        max_backjumps = self.max_backjumps
+        num_states_visited = self.num_states_visited
+        num_backjumps = self.num_backjumps
+
         prev_depth = None
+        # States popped from the same cost bucket share the same cost object,
+        # and the cost bounds only change when a goal state is returned, so
+        # the bound checks need repeating only when the cost object changes.
+        prev_cost: object = _NO_COST
         while (
-            self.pqueue.qsize() > 0
-            and (not self.stop_at_first_min or not self.min_reached)
-            and (self.max_backjumps is None or self.num_backjumps < self.max_backjumps)
+            pqueue_qsize() > 0
+            and (not stop_at_first_min or not self.min_reached)
+            and (max_backjumps is None or num_backjumps < max_backjumps)
         ):
-            state, depth, cost = self.pqueue.get()
+            state, depth, cost = pqueue_get()
 
-            self.update_minimum_reached(cost)
-            if cost is None or self.cost_bounds_exceeded(cost):
-                return None, None
+            if cost is not prev_cost:
+                self.update_minimum_reached(cost)
+                if cost is None or self.cost_bounds_exceeded(cost):
+                    self.num_states_visited = num_states_visited
+                    self.num_backjumps = num_backjumps
+                    return None, None
+                prev_cost = cost
 
-            self.num_states_visited += 1
+            num_states_visited += 1
 
             if prev_depth is not None and depth <= prev_depth:
-                self.num_backjumps += 1
+                num_backjumps += 1
 
             prev_depth = depth
-            self.goal_state_func = cast(Callable, self.goal_state_func)
-            if self.goal_state_func(state, *args):
+            if goal_state_func(state, *args):
+                self.num_states_visited = num_states_visited
+                self.num_backjumps = num_backjumps
                 self.penultimate_stats = self.get_stats()
                 self.update_upperbound_goal_state(state, *args)
                 self.update_minimum_reached(cost)
 
                 return state, cost
 
-            self.next_state_func = cast(Callable, self.next_state_func)
-            next_state_list = self.next_state_func(state, *args)
+            next_state_list = next_state_func(state, *args)
             self.put(next_state_list, depth + 1, args)
 
+        self.num_states_visited = num_states_visited
+        self.num_backjumps = num_backjumps
+
         # If all states have been explored, then the minimum has been reached
-        if self.pqueue.qsize() == 0:
+        if pqueue_qsize() == 0:
             self.min_reached = True
 
         return None, None
@@ -369,13 +487,30 @@ class BestFirstSearch:
         """Push a list of (next) states onto the best-first priority queue."""
         self.num_next_states += len(state_list)
 
-        for state in state_list:
-            assert self.cost_func is not None
-            cost = self.cost_func(state, *args)
-
-            if self.upperbound_cost is None or cost <= self.upperbound_cost:
-                self.pqueue.put(state, depth, cost)
-                self.num_enqueues += 1
+        # The cost function and bound cannot change while this batch is
+        # being pushed, so look them up once rather than once per state.
+        upperbound_cost = self.upperbound_cost
+        costs: Iterable[float | tuple[float, float] | None]
+        if self.cost_func_batch is not None:
+            costs = self.cost_func_batch(state_list, upperbound_cost, *args)
+        else:
+            cost_func = self.cost_func
+            assert cost_func is not None
+            costs = (
+                (cost if upperbound_cost is None or cost <= upperbound_cost else None)
+                for cost in (cost_func(state, *args) for state in state_list)
+            )
+
+        kept_states: list[DisjointSubcircuitsState] = []
+        kept_costs: list[float | tuple[float, float]] = []
+
+        for state, cost in zip(state_list, costs):
+            if cost is not None:
+                kept_states.append(state)
+                kept_costs.append(cost)
+
+        self.pqueue.put_batch(kept_states, depth, kept_costs)
+        self.num_enqueues += len(kept_states)
 
     def update_minimum_reached(
         self, min_cost: None | float | tuple[float, float]
@@ -16,7 +16,8 @@ from __future__ import annotations
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction, Gate
 from .optimization_settings import OptimizationSettings
-from typing import TYPE_CHECKING, cast, Callable
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .cut_optimization import CutOptimizationFuncArgs  # pragma: no cover
@@ -25,6 +26,7 @@ from .search_space_generator import SearchFunctions
 from .best_first_search import BestFirstSearch
 from .circuit_interface import CircuitElement, SimpleGateList
 from ..qpd import QPDBasis
+from ..qpd.decompositions import _instruction_cache_key
 
 
 def qc_to_cco_circuit(circuit: QuantumCircuit) -> list[str | CircuitElement]:
@@ -45,13 +47,19 @@ def qc_to_cco_circuit(circuit: QuantumCircuit) -> list[str | CircuitElement]:
     measurements, as needed.
     """
     circuit_list_rep = []
+    gammas: dict[Hashable, float] = {}
     for inst in circuit.data:
         if inst.operation.name == "barrier" and len(inst.qubits) == circuit.num_qubits:
             circuit_element: CircuitElement | str = "barrier"
         else:
             gamma = None
             if isinstance(inst.operation, Gate) and len(inst.qubits) == 2:
-                gamma = QPDBasis.from_instruction(inst.operation).kappa
+                key = _instruction_cache_key(inst.operation)
+                gamma = gammas.get(key) if key is not None else None
+                if gamma is None:
+                    gamma = QPDBasis.from_instruction(inst.operation).kappa
+                    if key is not None:
+                        gammas[key] = gamma
             name = inst.operation.name
             params = inst.operation.params
             circuit_element = CircuitElement(
@@ -107,16 +115,22 @@ def select_search_engine(
     main search engine fail to find a solution given the constraints
     on the computation it is allowed to perform.
     """
-    engine = optimization_settings.get_engine_selection(stage_of_optimization)
+    validate_search_engine(stage_of_optimization, optimization_settings)
 
-    if engine == "BestFirst":
-        return BestFirstSearch(
-            optimization_settings,
-            search_space_funcs,
-            stop_at_first_min=stop_at_first_min,
-        )
+    return BestFirstSearch(
+        optimization_settings,
+        search_space_funcs,
+        stop_at_first_min=stop_at_first_min,
+    )
 
-    else:
+
+def validate_search_engine(
+    stage_of_optimization: str, optimization_settings: OptimizationSettings
+) -> None:
+    """Raise a ValueError if the search engine selected for the given stage is not supported."""
+    engine = optimization_settings.get_engine_selection(stage_of_optimization)
+
+    if engine != "BestFirst":
         raise ValueError(f"Search engine {engine} is not supported.")
 
 
@@ -130,22 +144,19 @@ def greedy_best_first_search(
     The resulting goal state is returned, or None if a deadend is reached. Any additional input argumnets
     are passed as additional arguments to the search-space functions.
     """
-    search_space_funcs.goal_state_func = cast(
-        Callable, search_space_funcs.goal_state_func
-    )
-    search_space_funcs.cost_func = cast(Callable, search_space_funcs.cost_func)
-    search_space_funcs.next_state_func = cast(
-        Callable, search_space_funcs.next_state_func
-    )
-
-    while not search_space_funcs.goal_state_func(state, *args):
+    goal_state_func = search_space_funcs.goal_state_func
+    cost_func = search_space_funcs.cost_func
+    next_state_func = search_space_funcs.next_state_func
+    assert goal_state_func is not None
+    assert cost_func is not None
+    assert next_state_func is not None
+
+    while not goal_state_func(state, *args):
         best = min(
-            [
-                (search_space_funcs.cost_func(next_state, *args), k, next_state)
-                for k, next_state in enumerate(
-                    search_space_funcs.next_state_func(state, *args)
-                )
-            ],
+            (
+                (cost_func(next_state, *args), k, next_state)
+                for k, next_state in enumerate(next_state_func(state, *args))
+            ),
             default=(None, None, None),
         )
         if best[-1] is None:  # pragma: no cover
@@ -12,12 +12,22 @@
 """Quantum circuit representation compatible with cut-finding optimizer."""
 from __future__ import annotations
 
-import copy
+import sys
 import numpy as np
 import string
 from numpy.typing import NDArray
 from abc import ABC, abstractmethod
-from typing import NamedTuple, Hashable, Iterable, cast, Sequence
+from typing import Any, NamedTuple, Hashable, Iterable, cast, Sequence
+
+# Gate names are interned on ingest so that they can be compared by identity.
+_BARRIER = sys.intern("barrier")
+
+# Single-character labels for subcircuits, used by
+# :meth:`SimpleGateList.export_subcircuits_as_string`.
+_SUBCIRCUIT_ALPHABET = string.ascii_uppercase + string.ascii_lowercase + string.digits
+
+# Sentinel for dictionary look-ups of names that have not been assigned an ID.
+_MISSING: Any = object()
 
 
 class CircuitElement(NamedTuple):
@@ -119,7 +129,7 @@ class SimpleGateList(CircuitInterface):
     `circuit` (list): the internal representation of the circuit, which is
     a list of the following form:
 
-        [ ... [<gate_specification>, None] ...]
+        [ ... (<gate_specification>, None) ...]
 
     where <gate_specification> can be a string to denote a "barrier" across
     the entire circuit, or an instance of :class:`CircuitElement`.
@@ -133,7 +143,7 @@ class SimpleGateList(CircuitInterface):
     wires/qubits. After wire cuts ``new_circuit``has lists of the form
     ["move", <source_wire_id>, <destination_wire_id>] inserted into it.
 
-    `cut_type` (list): a list that assigns cut-type annotations to gates
+    `cut_type` (array): an object array that assigns cut-type annotations to gates
     in ``new_circuit``.
 
     `new_gate_ID`_map (array): an array that maps the positions of gates
@@ -147,13 +157,13 @@ class SimpleGateList(CircuitInterface):
     wire IDs defines a subcircuit.
     """
 
-    circuit: list
+    circuit: list[tuple[CircuitElement | str, None]]
     new_circuit: list
-    cut_type: list[str | None]
+    cut_type: NDArray[np.object_]
     qubit_names: NameToIDMap
     num_qubits: int
-    new_gate_ID_map: NDArray[np.int_]
-    output_wires: NDArray[np.int_]
+    new_gate_id_map: NDArray[np.int32]
+    output_wires: NDArray[np.int32]
 
     def __init__(
         self,
@@ -165,28 +175,39 @@ class SimpleGateList(CircuitInterface):
 
         self.circuit = []
         self.new_circuit = []
-        self.cut_type = []
         for gate in input_circuit:
-            self.cut_type.append(None)
             if not isinstance(gate, CircuitElement):
                 assert gate == "barrier"
-                self.circuit.append([copy.deepcopy(gate), None])
-                self.new_circuit.append(copy.deepcopy(gate))
+                self.circuit.append((gate, None))
+                self.new_circuit.append(gate)
             else:
                 gate_spec = CircuitElement(
-                    name=gate.name,
+                    name=(
+                        sys.intern(gate.name)
+                        if isinstance(gate.name, str)
+                        else gate.name
+                    ),
                     params=gate.params,
                     qubits=[self.qubit_names.get_id(x) for x in gate.qubits],
                     gamma=gate.gamma,
                 )
-                self.circuit.append([copy.deepcopy(gate_spec), None])
-                self.new_circuit.append(copy.deepcopy(gate_spec))
-        self.new_gate_id_map = np.arange(len(self.circuit), dtype=int)
+                # Only the qubit list of a gate in ``new_circuit`` is ever
+                # mutated (by wire cuts), so it alone needs its own copy.
+                self.circuit.append((gate_spec, None))
+                self.new_circuit.append(
+                    gate_spec._replace(qubits=list(gate_spec.qubits))
+                )
+        self.cut_type = np.full(len(self.circuit), None, dtype=object)
+        self._multiqubit_gates = self._extract_multiqubit_gates()
+        self._num_multiqubit_inputs = sum(
+            len(gate_spec.gate.qubits) for gate_spec in self._multiqubit_gates
+        )
+        self.new_gate_id_map = np.arange(len(self.circuit), dtype=np.int32)
         self.num_qubits = self.qubit_names.get_array_size_needed()
-        self.output_wires = np.arange(self.num_qubits, dtype=int)
+        self.output_wires = np.arange(self.num_qubits, dtype=np.int32)
 
         # Initialize the list of subcircuits assuming no cutting
-        self.subcircuits: Sequence[list[int] | int] = list(list(range(self.num_qubits)))
+        self.subcircuits: list[list[int]] = [list(range(self.num_qubits))]
 
     def get_num_qubits(self) -> int:
         """Return the number of qubits in the input circuit."""
@@ -202,22 +223,32 @@ class SimpleGateList(CircuitInterface):
         """Extract the multiqubit gates from the circuit and prepend the index of the gate in the circuits to the gate specification.
 
         The elements of the resulting list are instances of :class:`GateSpec`.
+        The list is computed once at construction and must not be modified.
         """
+        return self._multiqubit_gates
+
+    def get_num_multiqubit_inputs(self) -> int:
+        """Return the total number of qubit inputs across the gates returned by :meth:`get_multiqubit_gates`."""
+        return self._num_multiqubit_inputs
+
+    def _extract_multiqubit_gates(self) -> list[GateSpec]:
+        """Scan the circuit for the gates returned by :meth:`get_multiqubit_gates`."""
         subcircuit: list[GateSpec] = []
-        for k, circ_element in enumerate(self.circuit):
-            gate = circ_element[0]
-            cut_constraints = circ_element[1]
+        append = subcircuit.append
+        for k, (gate, cut_constraints) in enumerate(self.circuit):
             assert cut_constraints is None
-            if gate != "barrier":
-                if len(gate.qubits) > 1 and gate.name != "barrier":  # type: ignore
-                    subcircuit.append(GateSpec(k, gate, cut_constraints))
+            if (
+                isinstance(gate, CircuitElement)
+                and len(gate.qubits) > 1
+                and gate.name is not _BARRIER
+            ):
+                append(GateSpec(k, gate, cut_constraints))
 
         return subcircuit
 
     def insert_gate_cut(self, gate_id: int, cut_type: str) -> None:
         """Mark the specified gate as being cut. The cut type in this release can only be "LO"."""
-        gate_pos = self.new_gate_id_map[gate_id]
-        self.cut_type[gate_pos] = cut_type
+        self.cut_type[self.new_gate_id_map[gate_id]] = cut_type
 
     def insert_wire_cut(
         self,
@@ -262,12 +293,12 @@ class SimpleGateList(CircuitInterface):
 
         # Insert a move operator
         self.new_circuit.insert(gate_pos, ["move", src_wire_id, dest_wire_id])
-        self.cut_type.insert(gate_pos, cut_type)
+        self.cut_type = np.insert(self.cut_type, gate_pos, cut_type)
         self.new_gate_id_map[gate_id:] += 1
 
         # Update the output wires
-        op = self.circuit[gate_id][0]
-        qubit = op.qubits[input_id - 1]
+        op = cast(CircuitElement, self.circuit[gate_id][0])
+        qubit = cast(int, op.qubits[input_id - 1])
         self.output_wires[qubit] = dest_wire_id
 
     def define_subcircuits(self, list_of_list_of_wires: list[list[int]]) -> None:
@@ -294,7 +325,14 @@ class SimpleGateList(CircuitInterface):
         then :meth:`default_wire_name_mapping` defines the name mapping.
         """
         wire_map = self.make_wire_mapping(name_mapping)
-        out = copy.deepcopy(self.new_circuit)
+        # Copy only the mutable wire lists; gate names and parameters are shared.
+        out: list = []
+        for inst in self.new_circuit:
+            if isinstance(inst, CircuitElement):
+                inst = inst._replace(qubits=list(inst.qubits))
+            elif isinstance(inst, list):
+                inst = list(inst)
+            out.append(inst)
 
         wire_map = cast(list, wire_map)
         self.replace_wire_ids(out, wire_map)
@@ -325,19 +363,19 @@ class SimpleGateList(CircuitInterface):
         """Return a string that maps qubits/wires in the output circuit to subcircuits.
 
         This mapping is done per this package's convention. This
-        method only works with mappings to numeric qubit/wire names.
+        method only works with mappings to numeric qubit/wire names,
+        and with at most 62 subcircuits, one per available label.
         """
-        wire_map = self.make_wire_mapping(name_mapping)
+        wire_map = np.asarray(self.make_wire_mapping(name_mapping), dtype=np.intp)
+
+        assert len(self.subcircuits) <= len(
+            _SUBCIRCUIT_ALPHABET
+        ), f"Too many subcircuits ({len(self.subcircuits)}) for single-character labels"
 
-        out: Sequence[int | str] = list(range(self.get_num_wires()))
-        out = cast(list, out)
-        alphabet = string.ascii_uppercase + string.ascii_lowercase
-        for k, subcircuit in enumerate(self.subcircuits):
-            subcircuit = cast(list, subcircuit)
-            for wire in subcircuit:
-                wire_map = cast(list, wire_map)
-                out[wire_map[wire]] = alphabet[k]
-        return "".join(out)
+        out = np.empty(self.get_num_wires(), dtype="U1")
+        for label, subcircuit in zip(_SUBCIRCUIT_ALPHABET, self.subcircuits):
+            out[wire_map[np.asarray(subcircuit, dtype=np.intp)]] = label
+        return "".join(out.tolist())
 
     def make_wire_mapping(
         self, name_mapping: None | str | dict
@@ -356,11 +394,12 @@ class SimpleGateList(CircuitInterface):
         elif name_mapping == "default":
             name_mapping = self.default_wire_name_mapping()  # type: ignore
 
-        wire_mapping: list[int | tuple[str, int]] = []
-
-        for k in self.qubit_names.get_ids():
-            name_mapping = cast(dict, name_mapping)
-            wire_mapping.append(name_mapping[self.qubit_names.get_name(k)])
+        name_mapping = cast(dict, name_mapping)
+        wire_mapping: list[int | tuple[str, int]] = [
+            name_mapping[name]
+            for name in self.qubit_names.names_by_id
+            if name is not None
+        ]
 
         return wire_mapping
 
@@ -370,7 +409,10 @@ class SimpleGateList(CircuitInterface):
         Cut wires are assigned numeric IDs that are adjacent to the numeric ID of the wire prior to cutting so that Move
         operators are then applied against adjacent qubits. This is ensured by :meth:`SimpleGateList.sort_order`.
         """
-        name_pairs = [(name, self.sort_order(name)) for name in self.get_wire_names()]
+        cache: dict[Hashable, int | float] = {}
+        name_pairs = [
+            (name, self.sort_order(name, cache)) for name in self.get_wire_names()
+        ]
 
         name_pairs.sort(key=lambda x: x[1])
 
@@ -380,16 +422,29 @@ class SimpleGateList(CircuitInterface):
 
         return name_map
 
-    def sort_order(self, name: Hashable) -> int | float:
-        """Order numeric IDs of wires to enable :meth:`SimpleGateList.default_wire_name_mapping`."""
-        if isinstance(name, tuple):
-            if name[0] == "cut":
-                x = self.sort_order(name[1])
-                x_int = int(x)
-                x_frac = x - x_int
-                return x_int + 0.5 * x_frac + 0.5
+    def sort_order(
+        self, name: Hashable, cache: dict[Hashable, int | float] | None = None
+    ) -> int | float:
+        """Order numeric IDs of wires to enable :meth:`SimpleGateList.default_wire_name_mapping`.
 
-        return self.qubit_names.get_id(name)
+        If a ``cache`` dictionary is provided, it is used to memoize the orders
+        computed for ``name`` and for the wires it was cut from.
+        """
+        if cache is not None and name in cache:
+            return cache[name]
+
+        order: int | float
+        if isinstance(name, tuple) and name[0] == "cut":
+            x = self.sort_order(name[1], cache)
+            x_int = int(x)
+            x_frac = x - x_int
+            order = x_int + 0.5 * x_frac + 0.5
+        else:
+            order = self.qubit_names.item_dict[name]
+
+        if cache is not None:
+            cache[name] = order
+        return order
 
     def replace_wire_ids(
         self,
@@ -400,11 +455,9 @@ class SimpleGateList(CircuitInterface):
         """Iterate through a list of gates and replace wire IDs with the values defined by the ``wire_map``."""
         for inst in gate_list:
             if isinstance(inst, CircuitElement):
-                for k in range(len(inst.qubits)):
-                    inst.qubits[k] = wire_map[inst.qubits[k]]  # type: ignore
+                inst.qubits[:] = [wire_map[q] for q in inst.qubits]  # type: ignore
             elif isinstance(inst, list):
-                for k in range(1, len(inst)):
-                    inst[k] = wire_map[inst[k]]
+                inst[1:] = [wire_map[w] for w in inst[1:]]
 
 
 class NameToIDMap:
@@ -417,7 +470,10 @@ class NameToIDMap:
         """
         self.next_id: int = 0
         self.item_dict: dict[Hashable, int] = {}
-        self.id_dict: dict[int, Hashable] = {}
+        # Names indexed by ID; None marks IDs that have not been assigned.
+        self.names_by_id: list[Hashable | None] = []
+        # IDs can only be taken out of order once define_id has been called.
+        self._has_defined_ids: bool = False
 
         for name in init_names:
             self.get_id(name)
@@ -428,35 +484,51 @@ class NameToIDMap:
         If the hashable item does not yet appear in the item dictionary, a new
         item ID is assigned.
         """
-        if item_name not in self.item_dict:
-            while self.next_id in self.id_dict:  # pragma: no cover
+        item_id = self.item_dict.get(item_name, _MISSING)
+        if item_id is not _MISSING:
+            return item_id
+
+        return self._assign_id(item_name)
+
+    def _assign_id(self, item_name: Hashable) -> int:
+        """Assign the next available ID to ``item_name``, which must not yet have an ID."""
+        if self._has_defined_ids:
+            while self.get_name(self.next_id) is not None:
                 self.next_id += 1
 
-            self.item_dict[item_name] = self.next_id
-            self.id_dict[self.next_id] = item_name
-            self.next_id += 1
+        item_id = self.next_id
+        self.item_dict[item_name] = item_id
+        self._set_name(item_id, item_name)
+        self.next_id += 1
 
-        return self.item_dict[item_name]
+        return item_id
 
     def define_id(self, item_id: int, item_name: Hashable) -> None:
         """Assign a specific ID number to an item name."""
-        assert item_id not in self.id_dict, f"item ID {item_id} already assigned"
+        assert self.get_name(item_id) is None, f"item ID {item_id} already assigned"
         assert (
             item_name not in self.item_dict
         ), f"item name {item_name} already assigned"
 
         self.item_dict[item_name] = item_id
-        self.id_dict[item_id] = item_name
+        self._set_name(item_id, item_name)
+        self._has_defined_ids = True
+
+    def _set_name(self, item_id: int, item_name: Hashable) -> None:
+        """Record ``item_name`` under ``item_id``, growing ``names_by_id`` as needed."""
+        if item_id >= len(self.names_by_id):
+            self.names_by_id.extend([None] * (item_id + 1 - len(self.names_by_id)))
+        self.names_by_id[item_id] = item_name
 
     def get_name(self, item_id: int) -> Hashable | None:
         """Return the name associated with the specified ``item_id``.
 
         None is returned if ``item_id`` does not (yet) exist.
         """
-        if item_id not in self.id_dict:
-            return None
+        if item_id < len(self.names_by_id):
+            return self.names_by_id[item_id]
 
-        return self.id_dict[item_id]
+        return None
 
     def get_num_items(self) -> int:
         """Return the number of hashable items loaded thus far."""
@@ -467,15 +539,12 @@ class NameToIDMap:
 
         The value returned is thus the minimum size needed for a Python/Numpy array that maps item IDs to other hashables.
         """
-        if self.get_num_items() == 0:  # pragma: no cover
-            return 0
-
-        return 1 + max(self.id_dict.keys())
+        return len(self.names_by_id)
 
     def get_items(self) -> Iterable[Hashable]:
         """Return the keys of the dictionary of hashable items loaded thus far."""
         return self.item_dict.keys()
 
     def get_ids(self) -> Iterable[int]:
-        """Return the keys of the dictionary of ID's assigned to hashable items loaded thus far."""
-        return self.id_dict.keys()
+        """Return the ID's assigned to hashable items loaded thus far."""
+        return [k for k, name in enumerate(self.names_by_id) if name is not None]
@@ -15,24 +15,31 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import math
 import numpy as np
 from dataclasses import dataclass
+from itertools import chain
 from typing import cast
 from .search_space_generator import ActionNames
-from .cco_utils import select_search_engine, greedy_best_first_search
+from .cco_utils import (
+    select_search_engine,
+    validate_search_engine,
+    greedy_best_first_search,
+)
 from .cutting_actions import disjoint_subcircuit_actions
 from .search_space_generator import (
     get_action_subset,
     SearchFunctions,
     SearchSpaceGenerator,
 )
-from .best_first_search import SearchStats
+from .best_first_search import SearchStats, _EMPTY_STATS
 from .disjoint_subcircuits_state import DisjointSubcircuitsState
 from .circuit_interface import SimpleGateList, GateSpec
 from .optimization_settings import OptimizationSettings
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..automated_cut_finding import DeviceConstraints
+    from .cutting_actions import DisjointSearchAction
 
 
 @dataclass
@@ -43,6 +50,34 @@ class CutOptimizationFuncArgs:
     search_actions: ActionNames | None = None
     max_gamma: float | int | None = None
     qpu_width: int | None = None
+    action_lists_by_level: list[list[DisjointSearchAction] | None] | None = None
+    num_entangling_gates: int | None = None
+
+
+def get_action_lists_by_level(
+    entangling_gates: list[GateSpec], search_actions: ActionNames
+) -> list[list[DisjointSearchAction] | None]:
+    """Return, for each entangling gate, the cutting actions that can be applied to it.
+
+    The actions depend only on the gate and on any user-specified cut constraints,
+    so they are computed once per search rather than once per state expanded.
+    ``None`` is recorded for gates that cannot be handled by the search actions.
+    """
+    two_qubit_actions = search_actions.get_group("TwoQubitGates")
+    # Most gates share the same (usually absent) cut constraints, so the
+    # subsets are memoized by constraints.
+    subsets: dict[tuple | None, list[DisjointSearchAction] | None] = {}
+    action_lists: list[list[DisjointSearchAction] | None] = []
+    for gate_spec in entangling_gates:
+        if len(gate_spec.gate.qubits) == 2:
+            constraints = gate_spec.cut_constraints
+            key = None if constraints is None else tuple(constraints)
+            if key not in subsets:
+                subsets[key] = get_action_subset(two_qubit_actions, constraints)
+            action_lists.append(subsets[key])
+        else:
+            action_lists.append(None)
+    return action_lists
 
 
 def cut_optimization_cost_func(
@@ -72,6 +107,30 @@ def cut_optimization_upper_bound_cost_func(
         )
 
 
+def cut_optimization_upper_bound_cost_func_batch(
+    state_list: list[DisjointSubcircuitsState],
+    upperbound_cost: tuple[float, float] | None,
+    func_args: CutOptimizationFuncArgs,
+) -> list[tuple[float, float] | None]:
+    """Return :func:`cut_optimization_upper_bound_cost_func` for each state, or ``None`` where it exceeds ``upperbound_cost``."""
+    # pylint: disable=unused-argument
+    gammas = np.fromiter(
+        (state.upper_bound_gamma() for state in state_list),
+        dtype=float,
+        count=len(state_list),
+    )
+    if upperbound_cost is None:
+        keep = np.ones(len(state_list), dtype=bool)
+    else:
+        ub_gamma, ub_width = upperbound_cost
+        keep = (gammas < ub_gamma) | ((gammas == ub_gamma) & (np.inf <= ub_width))
+
+    return [
+        (gamma, np.inf) if kept else None
+        for gamma, kept in zip(gammas.tolist(), keep.tolist())
+    ]
+
+
 def cut_optimization_min_cost_bound_func(
     func_args: CutOptimizationFuncArgs,
 ) -> tuple[float, float] | None:
@@ -89,42 +148,42 @@ def cut_optimization_next_state_func(
     assert func_args.entangling_gates is not None
     assert func_args.search_actions is not None
 
-    # Get the entangling gate spec that is to be processed next based
-    # on the search level of the input state.
-
-    gate_spec = func_args.entangling_gates[state.get_search_level()]
-
-    # Determine which cutting actions can be performed, taking into
-    # account any user-specified constraints that might have been
-    # placed on how the current entangling gate is to be handled.
+    if func_args.action_lists_by_level is None:
+        func_args.action_lists_by_level = get_action_lists_by_level(
+            func_args.entangling_gates, func_args.search_actions
+        )
 
-    gate = gate_spec.gate
-    if len(gate.qubits) == 2:
-        action_list = func_args.search_actions.get_group("TwoQubitGates")
-    else:
+    # Get the entangling gate spec that is to be processed next based
+    # on the search level of the input state, along with the cutting
+    # actions that can be performed on it.
+    level = state.get_search_level()
+    gate_spec = func_args.entangling_gates[level]
+    action_list = func_args.action_lists_by_level[level]
+
+    if action_list is None:
+        gate = gate_spec.gate
         raise ValueError(
             "The input circuit must contain only single and two-qubits gates. Found "
             f"{len(gate.qubits)}-qubit gate: ({gate.name})."
         )
 
-    gate_actions = gate_spec.cut_constraints
-    action_list = get_action_subset(action_list, gate_actions)
-
     # Apply the search actions to generate a list of next states.
-    next_state_list = []
-    assert action_list is not None
-    for action in action_list:
-        func_args.qpu_width = cast(int, func_args.qpu_width)
-        next_state_list.extend(action.next_state(state, gate_spec, func_args.qpu_width))
-    return next_state_list
+    qpu_width = cast(int, func_args.qpu_width)
+    return list(
+        chain.from_iterable(
+            action.next_state(state, gate_spec, qpu_width) for action in action_list
+        )
+    )
 
 
 def cut_optimization_goal_state_func(
     state: DisjointSubcircuitsState, func_args: CutOptimizationFuncArgs
 ) -> bool:
     """Return True if the input state is a goal state."""
-    func_args.entangling_gates = cast(list, func_args.entangling_gates)
-    return state.get_search_level() >= len(func_args.entangling_gates)
+    if func_args.num_entangling_gates is None:
+        func_args.entangling_gates = cast(list, func_args.entangling_gates)
+        func_args.num_entangling_gates = len(func_args.entangling_gates)
+    return state.get_search_level() >= func_args.num_entangling_gates
 
 
 # Global variable that holds the search-space functions for generating
@@ -135,15 +194,36 @@ cut_optimization_search_funcs = SearchFunctions(
     next_state_func=cut_optimization_next_state_func,
     goal_state_func=cut_optimization_goal_state_func,
     mincost_bound_func=cut_optimization_min_cost_bound_func,
+    cost_func_batch=cut_optimization_upper_bound_cost_func_batch,
 )
 
 
+def make_cut_optimization_func_args(
+    circuit_interface: SimpleGateList,
+    optimization_settings: OptimizationSettings,
+    device_constraints: DeviceConstraints,
+    search_actions: ActionNames,
+) -> CutOptimizationFuncArgs:
+    """Populate the arguments passed to the cut optimization search-space functions."""
+    func_args = CutOptimizationFuncArgs()
+    func_args.entangling_gates = circuit_interface.get_multiqubit_gates()
+    func_args.search_actions = search_actions
+    func_args.max_gamma = optimization_settings.get_max_gamma
+    func_args.qpu_width = device_constraints.get_qpu_width()
+    func_args.action_lists_by_level = get_action_lists_by_level(
+        func_args.entangling_gates, search_actions
+    )
+    func_args.num_entangling_gates = len(func_args.entangling_gates)
+    return func_args
+
+
 def greedy_cut_optimization(
     circuit_interface: SimpleGateList,
     optimization_settings: OptimizationSettings,
     device_constraints: DeviceConstraints,
     search_space_funcs: SearchFunctions = cut_optimization_search_funcs,
     search_actions: ActionNames = disjoint_subcircuit_actions,
+    func_args: CutOptimizationFuncArgs | None = None,
 ) -> DisjointSubcircuitsState | None:
     """Peform a first pass at cut optimization using greedy best first search.
 
@@ -151,12 +231,14 @@ def greedy_cut_optimization(
     specified constraint ``max_gamma``. Its primary purpose is to estimate an upper
     bound on the actual minimum gamma. Its secondary purpose is to provide a guaranteed
     "anytime" solution (`<https://en.wikipedia.org/wiki/Anytime_algorithm>`).
+
+    If ``func_args`` is provided, it must have been populated for the same circuit,
+    settings, constraints and ``search_actions``, and is used as is.
     """
-    func_args = CutOptimizationFuncArgs()
-    func_args.entangling_gates = circuit_interface.get_multiqubit_gates()
-    func_args.search_actions = search_actions
-    func_args.max_gamma = optimization_settings.get_max_gamma
-    func_args.qpu_width = device_constraints.get_qpu_width()
+    if func_args is None:
+        func_args = make_cut_optimization_func_args(
+            circuit_interface, optimization_settings, device_constraints, search_actions
+        )
 
     start_state = DisjointSubcircuitsState(
         circuit_interface.get_num_qubits(), max_wire_cuts_circuit(circuit_interface)
@@ -164,6 +246,47 @@ def greedy_cut_optimization(
     return greedy_best_first_search(start_state, search_space_funcs, func_args)
 
 
+class _TrivialSearchEngine:
+    """Stand-in for a search engine when a known goal state is already optimal.
+
+    :meth:`optimization_pass` returns the goal state once, and ``None``
+    thereafter. No search is performed, so the statistics are all zero.
+    """
+
+    def __init__(
+        self, goal_state: DisjointSubcircuitsState, cost: float | tuple[float, float]
+    ):
+        """Assign member variables."""
+        self.goal_state: DisjointSubcircuitsState | None = goal_state
+        self.upperbound_cost = cost
+
+    def optimization_pass(
+        self, *args: CutOptimizationFuncArgs
+    ) -> tuple[DisjointSubcircuitsState | None, float | tuple[float, float] | None]:
+        """Return the goal state on the first call, and ``None`` on subsequent calls."""
+        state, self.goal_state = self.goal_state, None
+        if state is None:
+            return None, None
+        return state, self.upperbound_cost
+
+    def minimum_reached(self) -> bool:
+        """Return True, since the goal state is known to be optimal."""
+        return True
+
+    def get_stats(self, penultimate: bool = False) -> SearchStats:
+        """Return statistics with zero counts, since no search is performed."""
+        return _EMPTY_STATS
+
+    def get_upperbound_cost(self) -> float | tuple[float, float]:
+        """Return the current upperbound cost."""
+        return self.upperbound_cost
+
+    def update_upperbound_cost(self, cost_bound: float | tuple[float, float]) -> None:
+        """Update the cost upper bound based on an input cost bound."""
+        if cost_bound is not None and cost_bound < self.upperbound_cost:  # type: ignore
+            self.upperbound_cost = cost_bound
+
+
 class CutOptimization:
     """Implement cut optimization whereby qubits are not reused.
 
@@ -226,21 +349,27 @@ class CutOptimization:
         self.search_funcs = search_space_funcs
         self.search_actions = cut_actions
 
-        self.func_args = CutOptimizationFuncArgs()
-        self.func_args.entangling_gates = self.circuit.get_multiqubit_gates()
-        self.func_args.search_actions = self.search_actions
-        self.func_args.max_gamma = self.settings.get_max_gamma
-        self.func_args.qpu_width = self.constraints.get_qpu_width()
+        self.func_args = make_cut_optimization_func_args(
+            self.circuit, self.settings, self.constraints, self.search_actions
+        )
 
         # Perform an initial greedy best-first search to determine an upper
-        # bound for the optimal gamma
-        self.greedy_goal_state = greedy_cut_optimization(
-            self.circuit,
-            self.settings,
-            self.constraints,
-            search_space_funcs=self.search_funcs,
-            search_actions=self.search_actions,
-        )
+        # bound for the optimal gamma, unless the settings ask to rely on
+        # max_gamma alone for that bound.
+        if (
+            self.settings.get_skip_greedy_if_bounded
+            and self.func_args.max_gamma is not None
+        ):
+            self.greedy_goal_state = None
+        else:
+            self.greedy_goal_state = greedy_cut_optimization(
+                self.circuit,
+                self.settings,
+                self.constraints,
+                search_space_funcs=self.search_funcs,
+                search_actions=self.search_actions,
+                func_args=self.func_args,
+            )
 
         # Use the upper bound for the optimal gamma to determine the maximum
         # number of wire cuts that can be performed.
@@ -250,10 +379,7 @@ class CutOptimization:
             mwc = max_wire_cuts_gamma(self.greedy_goal_state.upper_bound_gamma())
             max_wire_cuts = min(max_wire_cuts, mwc)
 
-        # The elif block below covers a rare edge case
-        # which would need a clever circuit to get tested.
-        # Excluded from test coverage for now.
-        elif self.func_args.max_gamma is not None:  # pragma: no cover
+        elif self.func_args.max_gamma is not None:
             mwc = max_wire_cuts_gamma(self.func_args.max_gamma)
             max_wire_cuts = min(max_wire_cuts, mwc)
 
@@ -262,6 +388,20 @@ class CutOptimization:
             self.circuit.get_num_qubits(), max_wire_cuts
         )
 
+        # A greedy solution that needs no cuts cannot be improved upon, so
+        # there is no need to run the search engine at all.
+        if (
+            self.greedy_goal_state is not None
+            and self.greedy_goal_state.upper_bound_gamma() <= 1
+        ):
+            validate_search_engine("CutOptimization", self.settings)
+            self.search_engine = _TrivialSearchEngine(
+                self.greedy_goal_state,
+                self.search_funcs.cost_func(self.greedy_goal_state, self.func_args),
+            )
+            self.goal_state_returned = False
+            return
+
         sq = select_search_engine(
             "CutOptimization",
             self.settings,
@@ -336,12 +476,11 @@ def max_wire_cuts_circuit(circuit_interface: SimpleGateList) -> int:
     loss of generality we can assume that wire cutting is
     performed only on the inputs to multiqubit gates.
     """
-    multiqubit_wires = [
-        len(x.gate.qubits) for x in circuit_interface.get_multiqubit_gates()
-    ]
-    return sum(multiqubit_wires)
+    return circuit_interface.get_num_multiqubit_inputs()
 
 
 def max_wire_cuts_gamma(max_gamma: float | int) -> int:
     """Calculate an upper bound on the maximum number of wire cuts that can be made, given the maximum allowed gamma."""
-    return int(np.ceil(np.log2(max_gamma + 1) - 1))
+    # This is ceil(log2(max_gamma + 1)) - 1, computed exactly: for any
+    # max_gamma >= 0, ceil(log2(max_gamma + 1)) == ceil(max_gamma).bit_length().
+    return math.ceil(max_gamma).bit_length() - 1
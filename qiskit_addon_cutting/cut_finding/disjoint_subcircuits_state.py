@@ -129,6 +129,20 @@ class DisjointSubcircuitsState:
     state resides, with 0 being the root of the search tree.
     """
 
+    __slots__ = (
+        "wiremap",
+        "num_wires",
+        "uptree",
+        "width",
+        "bell_pairs",
+        "gamma_LB",
+        "gamma_UB",
+        "no_merge",
+        "actions",
+        "cut_actions_list",
+        "level",
+    )
+
     def __init__(self, num_qubits: int | None = None, max_wire_cuts: int | None = None):
         """Initialize an instance of :class:`DisjointSubcircuitsState` with the specified configuration variables."""
         if not (
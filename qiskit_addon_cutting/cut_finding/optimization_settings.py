@@ -33,6 +33,12 @@ class OptimizationSettings:
     ``max_backjumps`` specifies any constraints on the maximum number of backjump
     operations that can be performed by the search algorithm.
 
+    ``skip_greedy_if_bounded`` specifies whether to skip the greedy best-first
+    search that is used to warm start the search engine, relying on ``max_gamma``
+    alone to bound the search. Doing so saves the cost of the greedy pass, but
+    the search then no longer falls back to a greedy solution when no solution
+    within ``max_gamma`` is found.
+
     ``seed`` is a seed used to provide a repeatable initialization
     of the pesudorandom number generators used by the optimization.
     If None is used as the random seed, then a seed is obtained using an
@@ -51,6 +57,7 @@ class OptimizationSettings:
     wire_locc_ancillas: bool = False
     wire_locc_no_ancillas: bool = False
     engine_selections: dict[str, str] | None = None
+    skip_greedy_if_bounded: bool = False
 
     def __post_init__(self):
         """Post-init method for the data class."""
@@ -81,6 +88,11 @@ class OptimizationSettings:
         """
         return self.max_backjumps
 
+    @property
+    def get_skip_greedy_if_bounded(self) -> bool:
+        """Return whether the greedy warm start is skipped when ``max_gamma`` bounds the search."""
+        return self.skip_greedy_if_bounded
+
     @property
     def get_seed(self) -> int | None:
         """Return the seed used to generate the pseudorandom numbers used in the optimizaton."""
@@ -111,9 +111,7 @@ def get_action_subset(
     groups = set(action_groups)
 
     assert action_list is not None
-    return [
-        a for a in action_list if len(groups.intersection(set(a.get_group_names()))) > 0
-    ]
+    return [a for a in action_list if not groups.isdisjoint(a.get_group_names())]
 
 
 @dataclass
@@ -131,6 +129,13 @@ class SearchFunctions:
     numerics. In the latter case, lexicographical comparisons are performed
     per Python semantics.
 
+    ``cost_func_batch``: either ``None`` or a function that takes a list of
+    search states and the current upper-bound cost (possibly ``None``) and
+    returns a list holding, for each state, either its ``cost_func`` value or
+    ``None`` if that value exceeds the upper bound. It lets the costing and
+    pruning of a whole list of next-states be done at once; if it is ``None``,
+    ``cost_func`` is applied state by state.
+
     ``next_state_func``: a function that returns a list
     of next states generated from the input state. A :class:`ActionNames`
     instance should be incorporated into the additional input arguments
@@ -190,6 +195,18 @@ class SearchFunctions:
         Callable[[CutOptimizationFuncArgs], None | tuple[float, float]] | None
     ) = None
 
+    cost_func_batch: (
+        Callable[
+            [
+                list[DisjointSubcircuitsState],
+                tuple[float, float] | None,
+                CutOptimizationFuncArgs,
+            ],
+            list[tuple[float, float] | None],
+        ]
+        | None
+    ) = None
+
 
 @dataclass
 class SearchSpaceGenerator:
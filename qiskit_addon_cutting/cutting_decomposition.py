@@ -13,6 +13,7 @@
 
 from __future__ import annotations
 
+from copy import copy
 from collections import defaultdict
 from collections.abc import Sequence, Hashable
 from typing import NamedTuple
@@ -21,12 +22,14 @@ from qiskit.circuit import (
     QuantumCircuit,
     CircuitInstruction,
     Barrier,
+    Instruction,
 )
 from qiskit.quantum_info import PauliList
 
 from .utils.observable_grouping import observables_restricted_to_subsystem
 from .utils.transforms import separate_circuit, _partition_labels_from_circuit
 from .qpd.qpd_basis import QPDBasis
+from .qpd.decompositions import _instruction_cache_key
 from .qpd.instructions import TwoQubitQPDGate
 
 
@@ -70,33 +73,37 @@ def partition_circuit_qubits(
     if not inplace:
         circuit = circuit.copy()
 
+    bit_index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    bases_cache: dict[Hashable, QPDBasis] = {}
+
     # Find 2-qubit gates spanning more than one partition and replace it with a QPDGate.
     for i, instruction in enumerate(circuit.data):
-        if instruction.operation.name == "barrier":
+        # Ignore local gates and gates that span only one partition, checking
+        # the cheapest conditions first since most gates are single-qubit
+        qubits = instruction.qubits
+        if len(qubits) <= 1:
             continue
-        qubit_indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
-        partitions_spanned = {partition_labels[idx] for idx in qubit_indices}
-
-        # Ignore local gates and gates that span only one partition
-        if (
-            len(qubit_indices) <= 1
-            or len(partitions_spanned) == 1
-            or isinstance(instruction.operation, Barrier)
-        ):
+        operation = instruction.operation
+        if operation.name == "barrier" or isinstance(operation, Barrier):
             continue
-
-        if len(qubit_indices) > 2:
+        qubit_indices = [bit_index[qubit] for qubit in qubits]
+        if len(qubit_indices) == 2:
+            if partition_labels[qubit_indices[0]] == partition_labels[qubit_indices[1]]:
+                continue
+        else:
+            if len({partition_labels[idx] for idx in qubit_indices}) == 1:
+                continue
             raise ValueError(
                 "Decomposition is only supported for two-qubit gates. Cannot "
-                f"decompose ({instruction.operation.name})."
+                f"decompose ({operation.name})."
             )
 
         # Nonlocal gate exists in two separate partitions
-        if isinstance(instruction.operation, TwoQubitQPDGate):
+        if isinstance(operation, TwoQubitQPDGate):
             continue
 
-        qpd_gate = TwoQubitQPDGate.from_instruction(instruction.operation)
-        circuit.data[i] = CircuitInstruction(qpd_gate, qubits=qubit_indices)
+        qpd_gate = _qpd_gate_from_instruction(operation, bases_cache)
+        circuit.data[i] = instruction.replace(operation=qpd_gate)
 
     return circuit
 
@@ -127,17 +134,36 @@ def cut_gates(
     if not inplace:
         circuit = circuit.copy()
 
+    bases_cache: dict[Hashable, QPDBasis] = {}
     bases = []
     for gate_id in gate_ids:
         gate = circuit.data[gate_id]
-        qubit_indices = [circuit.find_bit(qubit).index for qubit in gate.qubits]
-        qpd_gate = TwoQubitQPDGate.from_instruction(gate.operation)
+        qpd_gate = _qpd_gate_from_instruction(gate.operation, bases_cache)
         bases.append(qpd_gate.basis)
-        circuit.data[gate_id] = CircuitInstruction(qpd_gate, qubits=qubit_indices)
+        # Keep the instruction's qubits as they are, rather than resolving them
+        # again from indices
+        circuit.data[gate_id] = gate.replace(operation=qpd_gate)
 
     return circuit, bases
 
 
+def _qpd_gate_from_instruction(
+    operation: Instruction, bases_cache: dict[Hashable, QPDBasis], /
+) -> TwoQubitQPDGate:
+    """Create a :class:`.TwoQubitQPDGate`, reusing a basis already computed for an identical gate.
+
+    Each returned gate holds its own (shallow) copy of the cached basis, so that
+    setting the coefficients of one basis does not affect any other.
+    """
+    key = _instruction_cache_key(operation)
+    if key is None:
+        return TwoQubitQPDGate.from_instruction(operation)
+    basis = bases_cache.get(key)
+    if basis is None:
+        basis = bases_cache[key] = QPDBasis.from_instruction(operation)
+    return TwoQubitQPDGate(copy(basis), label=f"cut_{operation.name}")
+
+
 def partition_problem(
     circuit: QuantumCircuit,
     partition_labels: Sequence[Hashable] | None = None,
@@ -211,17 +237,30 @@ def partition_problem(
     # Partition the circuit with TwoQubitQPDGates and assign the order via their labels
     qpd_circuit = partition_circuit_qubits(circuit, partition_labels)
 
-    bases = []
-    i = 0
+    # Label each TwoQubitQPDGate with its cut id and decompose it into its two
+    # SingleQubitQPDGates, building the new instruction list in a single pass
+    # rather than passing the whole circuit through QuantumCircuit.decompose.
+    bases: list[QPDBasis] = []
+    instructions: list[CircuitInstruction] = []
     for inst in qpd_circuit.data:
-        if isinstance(inst.operation, TwoQubitQPDGate):
-            bases.append(inst.operation.basis)
-            inst.operation.label = f"{inst.operation.label}_{i}"
-            i += 1
+        operation = inst.operation
+        if not isinstance(operation, TwoQubitQPDGate):
+            instructions.append(inst)
+            continue
+        operation.label = f"{operation.label}_{len(bases)}"
+        bases.append(operation.basis)
+        qpd_gate1, qpd_gate2 = operation.definition.data
+        instructions.append(
+            CircuitInstruction(qpd_gate1.operation, qubits=[inst.qubits[0]])
+        )
+        instructions.append(
+            CircuitInstruction(qpd_gate2.operation, qubits=[inst.qubits[1]])
+        )
+    qpd_circuit = qpd_circuit.copy_empty_like()
+    qpd_circuit.data.extend(instructions)
 
     # Separate the decomposed circuit into its subcircuits
-    qpd_circuit_dx = qpd_circuit.decompose(TwoQubitQPDGate)
-    separated_circs = separate_circuit(qpd_circuit_dx, partition_labels)
+    separated_circs = separate_circuit(qpd_circuit, partition_labels)
 
     # Decompose the observables, if provided
     subobservables_by_subsystem = None
@@ -251,10 +290,12 @@ def decompose_observables(
     Returns:
         A dictionary mapping a partition to its associated sub-observables
     """
-    qubits_by_subsystem = defaultdict(list)
+    # Labels may be arbitrary hashables, and the first-seen order of the labels
+    # determines the order of the output, so group in a single pass here
+    # rather than sorting with ``np.unique``.
+    qubits_by_subsystem: dict[Hashable, list[int]] = defaultdict(list)
     for i, label in enumerate(partition_labels):
         qubits_by_subsystem[label].append(i)
-    qubits_by_subsystem = dict(qubits_by_subsystem)  # type: ignore
 
     subobservables_by_subsystem = {
         label: observables_restricted_to_subsystem(qubits, observables)
@@ -14,22 +14,29 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Sequence, Hashable
+from collections.abc import Sequence, Hashable, Iterator
+import math
 
 import numpy as np
-from qiskit.circuit import QuantumCircuit, ClassicalRegister
+from qiskit.circuit import (
+    QuantumCircuit,
+    ClassicalRegister,
+    CircuitInstruction,
+    Measure,
+)
+from qiskit.circuit.library import HGate, SXGate
 from qiskit.quantum_info import PauliList
 
-from .utils.iteration import strict_zip
 from .utils.observable_grouping import ObservableCollection, CommutingObservableGroup
 from .qpd import (
     WeightType,
     QPDBasis,
+    BaseQPDGate,
     SingleQubitQPDGate,
     TwoQubitQPDGate,
     generate_qpd_weights,
-    decompose_qpd_instructions,
 )
+from .qpd.decompose import _QPDDecomposer
 from .cutting_decomposition import decompose_observables
 
 
@@ -80,6 +87,8 @@ def generate_cutting_experiments(
         ValueError: :class:`SingleQubitQPDGate` instances must have their cut ID
             appended to the gate label so they may be associated with other gates belonging
             to the same cut.
+        ValueError: The cut IDs appended to the :class:`SingleQubitQPDGate` labels are not
+            the integers ``0`` through ``N-1``, where ``N`` is the number of cuts.
         ValueError: :class:`SingleQubitQPDGate` instances are not allowed in unseparated circuits.
     """
     if isinstance(circuits, QuantumCircuit) and not isinstance(observables, PauliList):
@@ -114,10 +123,9 @@ def generate_cutting_experiments(
         is_separated = True
         subcircuit_dict = circuits
         # Gather the unique bases across the subcircuits
-        subcirc_qpd_gate_ids, subcirc_map_ids = _get_mapping_ids_by_partition(
+        bases, subcirc_qpd_gate_ids, subcirc_map_ids = _get_bases_by_partition(
             subcircuit_dict
         )
-        bases = _get_bases_by_partition(subcircuit_dict, subcirc_qpd_gate_ids)
 
         # Create the commuting observable groups
         subsystem_observables = {
@@ -128,45 +136,67 @@ def generate_cutting_experiments(
     random_samples = generate_qpd_weights(bases, num_samples=num_samples)
 
     # Calculate terms in coefficient calculation
-    kappa = np.prod([basis.kappa for basis in bases])
+    kappa = math.prod(basis.kappa for basis in bases)
     num_samples = sum([value[0] for value in random_samples.values()])
 
     # Sort samples in descending order of frequency
     sorted_samples = sorted(random_samples.items(), key=lambda x: x[1][0], reverse=True)
 
+    # The measurement register and measurement instructions for each
+    # commuting observable group do not depend on the sample, so build them
+    # once up front and reuse them for every sample.  Likewise, validate each
+    # template's QPD gates only once, and build the local instructions replacing
+    # each (gate, map id) pair only the first time a sample requests it.
+    measurement_templates: dict[
+        Hashable, list[tuple[_QPDDecomposer, list[CircuitInstruction]]]
+    ] = defaultdict(list)
+    for label, so in subsystem_observables.items():
+        for cog in so.groups:
+            qc_with_register, measurements = _measurement_template(
+                subcircuit_dict[label], cog
+            )
+            measurement_templates[label].append(
+                (
+                    _QPDDecomposer(qc_with_register, subcirc_qpd_gate_ids[label]),
+                    list(measurements.data),
+                )
+            )
+
     # Generate the output experiments and their respective coefficients
-    subexperiments_dict: dict[Hashable, list[QuantumCircuit]] = defaultdict(list)
-    coefficients: list[tuple[float, WeightType]] = []
-    for z, (map_ids, (redundancy, weight_type)) in enumerate(sorted_samples):
-        actual_coeff = np.prod(
-            [basis.coeffs[map_id] for basis, map_id in strict_zip(bases, map_ids)]
+    map_ids_matrix = np.array(
+        [map_ids for map_ids, _ in sorted_samples], dtype=np.intp
+    ).reshape(len(sorted_samples), len(bases))
+    sampled_coeffs = _sampled_coefficients(
+        bases,
+        map_ids_matrix,
+        [redundancy for _, (redundancy, _) in sorted_samples],
+        kappa,
+        num_samples,
+    )
+    coefficients: list[tuple[float, WeightType]] = list(
+        zip(
+            sampled_coeffs.tolist(),
+            [weight_type for _, (_, weight_type) in sorted_samples],
         )
-        sampled_coeff = (redundancy / num_samples) * (kappa * np.sign(actual_coeff))
-        coefficients.append((sampled_coeff, weight_type))
-        map_ids_tmp = map_ids
-        for label, so in subsystem_observables.items():
-            subcircuit = subcircuit_dict[label]
-            if is_separated:
-                map_ids_tmp = tuple(map_ids[j] for j in subcirc_map_ids[label])
-            for j, cog in enumerate(so.groups):
-                new_qc = _append_measurement_register(subcircuit, cog)
-                decompose_qpd_instructions(
-                    new_qc, subcirc_qpd_gate_ids[label], map_ids_tmp, inplace=True
-                )
-                _append_measurement_circuit(new_qc, cog, inplace=True)
-                subexperiments_dict[label].append(new_qc)
-
-    # Remove initial and final resets from the subexperiments.  This will
-    # enable the `Move` operation to work on backends that don't support
-    # `Reset`, as long as qubits are not re-used.  See
-    # https://github.com/Qiskit/qiskit-addon-cutting/issues/452.
-    # While we are at it, we also consolidate each run of multiple resets
-    # (which can arise when re-using qubits) into a single reset.
-    for subexperiments in subexperiments_dict.values():
-        for circ in subexperiments:
-            _remove_resets_in_zero_state(circ)
-            _remove_final_resets(circ)
-            _consolidate_resets(circ)
+    )
+
+    # Gather, for every sample at once, the map ids of the bases in each subcircuit
+    if is_separated:
+        map_ids_by_label = {
+            label: [
+                tuple(row)
+                for row in map_ids_matrix[:, np.asarray(ids, dtype=np.intp)].tolist()
+            ]
+            for label, ids in subcirc_map_ids.items()
+        }
+    else:
+        map_ids_by_label = {"A": [map_ids for map_ids, _ in sorted_samples]}
+
+    subexperiments_dict: dict[Hashable, list[QuantumCircuit]] = defaultdict(list)
+    for label, subexperiment in _iter_subexperiments(
+        measurement_templates, map_ids_by_label, len(sorted_samples)
+    ):
+        subexperiments_dict[label].append(subexperiment)
 
     # If the input was a single quantum circuit, return the subexperiments as a list
     subexperiments_out: list[QuantumCircuit] | dict[Hashable, list[QuantumCircuit]] = (
@@ -180,20 +210,93 @@ def generate_cutting_experiments(
     return subexperiments_out, coefficients
 
 
-def _get_mapping_ids_by_partition(
+def _iter_subexperiments(
+    measurement_templates: dict[
+        Hashable, list[tuple[_QPDDecomposer, list[CircuitInstruction]]]
+    ],
+    map_ids_by_label: dict[Hashable, list[tuple[int, ...]]],
+    num_unique_samples: int,
+) -> Iterator[tuple[Hashable, QuantumCircuit]]:
+    """Yield each finished subexperiment, along with its partition label, one at a time.
+
+    The subexperiments are yielded sample by sample, in the order in which they
+    appear in the output of :func:`generate_cutting_experiments`.
+
+    Distinct samples can assign the same map ids to all the cuts within a
+    subcircuit (e.g., when that subcircuit is touched by only a few of the
+    cuts).  Such subexperiments are built only once; every later occurrence
+    is a copy of the first.
+    """
+    finished: dict[tuple[Hashable, tuple[int, ...]], list[QuantumCircuit]] = {}
+    for z in range(num_unique_samples):
+        for label, templates in measurement_templates.items():
+            map_ids = map_ids_by_label[label][z]
+            previous = finished.get((label, map_ids))
+            if previous is not None:
+                for subexperiment in previous:
+                    yield label, subexperiment.copy()
+                continue
+            subexperiments = finished[(label, map_ids)] = []
+            for decomposer, measurements in templates:
+                subexperiment = decomposer.decompose(map_ids, measurements)
+                # Remove initial and final resets from the subexperiment.  This
+                # will enable the `Move` operation to work on backends that don't
+                # support `Reset`, as long as qubits are not re-used.  See
+                # https://github.com/Qiskit/qiskit-addon-cutting/issues/452.
+                # While we are at it, we also consolidate each run of multiple
+                # resets (which can arise when re-using qubits) into a single reset.
+                _remove_resets_in_zero_state(subexperiment)
+                _remove_final_resets(subexperiment)
+                _consolidate_resets(subexperiment)
+                subexperiments.append(subexperiment)
+                yield label, subexperiment
+
+
+def _sampled_coefficients(
+    bases: Sequence[QPDBasis],
+    map_ids_matrix: np.ndarray,
+    redundancies: Sequence[int | float],
+    kappa: float,
+    num_samples: int | float,
+) -> np.ndarray:
+    """Return the coefficient of each sample, computed for all samples at once.
+
+    Row ``z`` of ``map_ids_matrix`` holds the map ids that sample ``z`` selects
+    from each basis. Each coefficient is the sample's share of ``num_samples``,
+    times ``kappa``, times the sign of the product of the selected basis coefficients.
+    """
+    num_bases = len(bases)
+    coeff_matrix = np.ones((num_bases, max((len(b.coeffs) for b in bases), default=0)))
+    for k, basis in enumerate(bases):
+        coeff_matrix[k, : len(basis.coeffs)] = basis.coeffs
+
+    # The sign of a product is the product of the signs; this also cannot
+    # underflow to zero the way a product of many small coefficients could.
+    gathered = coeff_matrix[np.arange(num_bases), map_ids_matrix]
+    signs = np.prod(np.sign(gathered), axis=1)
+
+    return (np.asarray(redundancies) / num_samples) * (kappa * signs)
+
+
+def _get_bases_by_partition(
     circuits: dict[Hashable, QuantumCircuit],
-) -> tuple[dict[Hashable, list[list[int]]], dict[Hashable, list[int]]]:
-    """Get indices to the QPD gates in each subcircuit and relevant map ids."""
-    # Collect QPDGate id's and relevant map id's for each subcircuit
+) -> tuple[list[QPDBasis], dict[Hashable, list[list[int]]], dict[Hashable, list[int]]]:
+    """Get each unique QPD basis, plus the QPD gate indices and relevant map ids of each subcircuit."""
+    # Collect the bases, QPDGate id's and relevant map id's in a single walk
+    # over each subcircuit, parsing every gate label only once.  The cut ids
+    # are the dense integers 0, ..., N-1, so each basis is written straight
+    # into its slot of the list.
+    bases: list[QPDBasis | None] = []
     subcirc_qpd_gate_ids: dict[Hashable, list[list[int]]] = {}
     subcirc_map_ids: dict[Hashable, list[int]] = {}
     for label, circ in circuits.items():
-        subcirc_qpd_gate_ids[label] = []
-        subcirc_map_ids[label] = []
+        qpd_gate_ids = subcirc_qpd_gate_ids[label] = []
+        map_ids = subcirc_map_ids[label] = []
         for i, inst in enumerate(circ.data):
-            if isinstance(inst.operation, SingleQubitQPDGate):
+            operation = inst.operation
+            if isinstance(operation, SingleQubitQPDGate):
                 try:
-                    decomp_id = int(inst.operation.label.split("_")[-1])
+                    decomp_id = int(operation.label.rpartition("_")[2])
                 except (AttributeError, ValueError) as ex:
                     raise ValueError(
                         "SingleQubitQPDGate instances in input circuit(s) must have their "
@@ -203,40 +306,41 @@ def _get_mapping_ids_by_partition(
                         ' formatted as "<your_label>_N". This allows SingleQubitQPDGates '
                         "belonging to the same cut to be sampled jointly."
                     ) from ex
-                subcirc_qpd_gate_ids[label].append([i])
-                subcirc_map_ids[label].append(decomp_id)
-
-    return subcirc_qpd_gate_ids, subcirc_map_ids
-
-
-def _get_bases_by_partition(
-    circuits: dict[Hashable, QuantumCircuit],
-    subcirc_qpd_gate_ids: dict[Hashable, list[list[int]]],
-) -> list[QPDBasis]:
-    """Get a list of each unique QPD basis across the subcircuits."""
-    # Collect the bases corresponding to each decomposed operation
-    bases_dict = {}
-    for label, subcirc in subcirc_qpd_gate_ids.items():
-        circuit = circuits[label]
-        for basis_id in subcirc:
-            decomp_id = int(circuit.data[basis_id[0]].operation.label.split("_")[-1])
-            bases_dict[decomp_id] = circuit.data[basis_id[0]].operation.basis
-    bases = [bases_dict[key] for key in sorted(bases_dict.keys())]
+                if decomp_id < 0:
+                    raise ValueError(
+                        f"Cut ids must be nonnegative, but found cut id ({decomp_id})."
+                    )
+                if decomp_id >= len(bases):
+                    bases.extend([None] * (decomp_id + 1 - len(bases)))
+                qpd_gate_ids.append([i])
+                map_ids.append(decomp_id)
+                bases[decomp_id] = operation.basis
+    for decomp_id, basis in enumerate(bases):
+        if basis is None:
+            raise ValueError(
+                "The cut ids suffixed to the SingleQubitQPDGate labels must be the "
+                f"integers 0 through {len(bases) - 1}, but no gate has cut id ({decomp_id})."
+            )
 
-    return bases
+    return bases, subcirc_qpd_gate_ids, subcirc_map_ids  # type: ignore[return-value]
 
 
 def _get_bases(circuit: QuantumCircuit) -> tuple[list[QPDBasis], list[list[int]]]:
     """Get a list of each unique QPD basis in the circuit and the QPDGate indices."""
     bases = []
     qpd_gate_ids = []
-    for i, inst in enumerate(circuit):
-        if isinstance(inst.operation, SingleQubitQPDGate):
+    for i, inst in enumerate(circuit.data):
+        operation = inst.operation
+        # Most instructions are not QPD gates, so rule those out with a single
+        # check before distinguishing between the QPD gate types.
+        if not isinstance(operation, BaseQPDGate):
+            continue
+        if isinstance(operation, SingleQubitQPDGate):
             raise ValueError(
                 "SingleQubitQPDGates are not supported in unseparable circuits."
             )
-        if isinstance(inst.operation, TwoQubitQPDGate):
-            bases.append(inst.operation.basis)
+        if isinstance(operation, TwoQubitQPDGate):
+            bases.append(operation.basis)
             qpd_gate_ids.append([i])
 
     return bases, qpd_gate_ids
@@ -340,25 +444,53 @@ def _append_measurement_circuit(
     #
     # Implement the necessary basis rotations and measurements, as
     # in BackendEstimator._measurement_circuit().
-    genobs_x = cog.general_observable.x
-    genobs_z = cog.general_observable.z
-    for clbit, subqubit in enumerate(pauli_indices):
+    #
+    # The instructions are built directly from the (singleton) gates and
+    # added in one batch, rather than through the per-gate circuit methods.
+    #
+    # The x and z bits of the measured qubits are gathered in one pass up front,
+    # rather than indexing the observable's arrays for each qubit.
+    genobs_x = cog.general_observable.x[pauli_indices].tolist()
+    genobs_z = cog.general_observable.z[pauli_indices].tolist()
+    qubits = qc.qubits
+    instructions: list[CircuitInstruction] = []
+    for clbit, (subqubit, x, z) in enumerate(zip(pauli_indices, genobs_x, genobs_z)):
         # subqubit is the index of the qubit in the subsystem.
         # actual_qubit is its index in the system of interest (if different).
-        actual_qubit = qubit_locations[subqubit]
-        if genobs_x[subqubit]:
-            if genobs_z[subqubit]:
+        actual_qubit = (qubits[qubit_locations[subqubit]],)
+        if x:
+            if z:
                 # Rotate Y basis to Z basis
-                qc.sx(actual_qubit)
+                instructions.append(CircuitInstruction(SXGate(), actual_qubit))
             else:
                 # Rotate X basis to Z basis
-                qc.h(actual_qubit)
+                instructions.append(CircuitInstruction(HGate(), actual_qubit))
         # Measure in Z basis
-        qc.measure(actual_qubit, obs_creg[clbit])
+        instructions.append(
+            CircuitInstruction(Measure(), actual_qubit, (obs_creg[clbit],))
+        )
+    qc.data.extend(instructions)
 
     return qc
 
 
+def _measurement_template(
+    qc: QuantumCircuit, cog: CommutingObservableGroup, /
+) -> tuple[QuantumCircuit, QuantumCircuit]:
+    """Prepare the sample-independent parts of the subexperiments for a ``CommutingObservableGroup``.
+
+    Returns:
+        A copy of ``qc`` with the measurement register appended, and an otherwise empty
+        circuit over the same bits that holds only the instructions which
+        :func:`_append_measurement_circuit` would append to it
+    """
+    qc_with_register = _append_measurement_register(qc, cog)
+    measurements = _append_measurement_circuit(
+        qc_with_register.copy_empty_like(), cog, inplace=True
+    )
+    return qc_with_register, measurements
+
+
 def _get_pauli_indices(cog: CommutingObservableGroup) -> list[int]:
     """Return the indices to qubits to be measured."""
     # If the circuit has no measurements, the Sampler will fail.  So, we
@@ -29,6 +29,10 @@ from .cutting_experiments import _get_pauli_indices
 from .qpd import WeightType
 
 
+# The parity of the number of set bits in each possible byte
+_BYTE_PARITY = np.array([bit_count(i) & 1 for i in range(256)], dtype=np.int8)
+
+
 def reconstruct_expectation_values(
     results: (
         SamplerResult
@@ -143,23 +147,17 @@ def reconstruct_expectation_values(
                 idx = i * len(so.groups) + k
                 if isinstance(current_result, SamplerResult):
                     # SamplerV1 provides a SamplerResult
-                    quasi_probs = current_result.quasi_dists[idx]
-                    for outcome, quasi_prob in quasi_probs.items():
-                        subsystem_expvals[k] += quasi_prob * _process_outcome(
-                            cog, outcome
-                        )
+                    subsystem_expvals[k] += _process_quasi_dist(
+                        cog, current_result.quasi_dists[idx]
+                    )
                 else:
                     # SamplerV2 provides a PrimitiveResult
                     data_pub = current_result[idx].data
-                    obs_array = data_pub.observable_measurements.array
-                    qpd_array = data_pub.qpd_measurements.array
-                    shots = qpd_array.shape[0]
-                    for j in range(shots):
-                        obs_outcomes = int.from_bytes(obs_array[j], "big")
-                        qpd_outcomes = int.from_bytes(qpd_array[j], "big")
-                        subsystem_expvals[k] += (1 / shots) * _process_outcome_v2(
-                            cog, obs_outcomes, qpd_outcomes
-                        )
+                    subsystem_expvals[k] += _process_outcomes_v2(
+                        cog,
+                        data_pub.observable_measurements.array,
+                        data_pub.qpd_measurements.array,
+                    )
 
             for k, subobservable in enumerate(subobservables_by_subsystem[label]):
                 current_expvals[k] *= np.mean(
@@ -225,6 +223,110 @@ def _process_outcome_v2(
     return rv
 
 
+def _process_outcomes_v2(
+    cog: CommutingObservableGroup,
+    obs_array: np.typing.NDArray[np.uint8],
+    qpd_array: np.typing.NDArray[np.uint8],
+    /,
+) -> np.typing.NDArray[np.float64]:
+    """
+    Process all shots of a QPD experiment with observables at once.
+
+    This is the vectorized equivalent of averaging :func:`_process_outcome_v2`
+    over every shot, working directly on the packed bytes of each register.
+
+    Args:
+        cog: The observable set being measured by the current experiment
+        obs_array: The ``observable_measurements`` outcomes, as a 2D array of
+            big-endian packed bytes with one row per shot
+        qpd_array: The ``qpd_measurements`` outcomes, as a 2D array of
+            big-endian packed bytes with one row per shot
+
+    Returns:
+        A 1D array of the observable measurements, averaged over all shots.  The
+        elements of this vector correspond to the elements of
+        ``cog.commuting_observables``.  If there are no shots, every element
+        is zero.
+    """
+    signs = _outcome_signs(cog, obs_array, qpd_array)
+    if signs.shape[0] == 0:
+        # An experiment without shots contributes nothing
+        return np.zeros(len(cog.commuting_observables))
+    return np.mean(signs, axis=0)
+
+
+def _process_quasi_dist(
+    cog: CommutingObservableGroup, quasi_dist: Mapping[int | str, float], /
+) -> np.typing.NDArray[np.float64]:
+    """
+    Process all outcomes of a QPD experiment with observables at once.
+
+    This is the vectorized equivalent of summing :func:`_process_outcome` over
+    every outcome of ``quasi_dist``, weighted by its quasi-probability.
+
+    Args:
+        cog: The observable set being measured by the current experiment
+        quasi_dist: The quasi-probability of each outcome of the classical bits
+
+    Returns:
+        A 1D array of the observable measurements, weighted by quasi-probability.
+        The elements of this vector correspond to the elements of
+        ``cog.commuting_observables``.
+    """
+    num_meas_bits = len(_get_pauli_indices(cog))
+    obs_mask = (1 << num_meas_bits) - 1
+
+    outcomes = [_outcome_to_int(outcome) for outcome in quasi_dist]
+    obs_outcomes = [outcome & obs_mask for outcome in outcomes]
+    qpd_outcomes = [outcome >> num_meas_bits for outcome in outcomes]
+    num_qpd_bits = max((outcome.bit_length() for outcome in qpd_outcomes), default=0)
+
+    signs = _outcome_signs(
+        cog,
+        _pack_outcomes(obs_outcomes, num_meas_bits),
+        _pack_outcomes(qpd_outcomes, num_qpd_bits),
+    )
+    quasi_probs = np.fromiter(quasi_dist.values(), dtype=float, count=len(outcomes))
+
+    return quasi_probs @ signs
+
+
+def _pack_outcomes(
+    outcomes: Sequence[int], num_bits: int, /
+) -> np.typing.NDArray[np.uint8]:
+    """Pack integer outcomes into big-endian bytes, with one row per outcome."""
+    num_bytes = max(1, (num_bits + 7) // 8)
+    return np.frombuffer(
+        b"".join(outcome.to_bytes(num_bytes, "big") for outcome in outcomes),
+        dtype=np.uint8,
+    ).reshape(len(outcomes), num_bytes)
+
+
+def _outcome_signs(
+    cog: CommutingObservableGroup,
+    obs_array: np.typing.NDArray[np.uint8],
+    qpd_array: np.typing.NDArray[np.uint8],
+    /,
+) -> np.typing.NDArray[np.int_]:
+    """Return the +1 or -1 measured for each observable of ``cog``, in each row of packed outcomes."""
+    # qpd_parity will be 1 or 0, depending on the overall parity of qpd
+    # measurements in each shot.
+    qpd_parity = _BYTE_PARITY[np.bitwise_xor.reduce(qpd_array, axis=1)]
+
+    # Pack each bitmask into bytes laid out like the rows of obs_array, so that
+    # the parity of every (shot, mask) pair can be computed at once.
+    num_bytes = obs_array.shape[1]
+    masks = np.array(
+        [list(mask.to_bytes(num_bytes, "big")) for mask in cog.pauli_bitmasks],
+        dtype=np.uint8,
+    ).reshape(len(cog.pauli_bitmasks), num_bytes)
+    obs_parity = _BYTE_PARITY[
+        np.bitwise_xor.reduce(obs_array[:, np.newaxis, :] & masks, axis=2)
+    ]
+
+    return 1 - 2 * (obs_parity ^ qpd_parity[:, np.newaxis])
+
+
 def _outcome_to_int(outcome: int | str) -> int:
     if isinstance(outcome, int):
         return outcome
@@ -22,7 +22,7 @@ from qiskit.circuit import (
     Measure,
 )
 
-from .instructions import BaseQPDGate, TwoQubitQPDGate
+from .instructions import BaseQPDGate, SingleQubitQPDGate, TwoQubitQPDGate
 
 
 def decompose_qpd_instructions(
@@ -81,6 +81,87 @@ def decompose_qpd_instructions(
     return circuit
 
 
+class _QPDDecomposer:
+    """
+    Decompose many copies of one circuit, each according to its own map IDs.
+
+    This produces the same circuits as :func:`decompose_qpd_instructions`, but the
+    validation is performed only once, and the local instructions which replace
+    each QPD gate are built only once per ``(gate, map ID)`` pair and then spliced
+    into every circuit which needs them.
+    """
+
+    def __init__(
+        self, circuit: QuantumCircuit, instruction_ids: Sequence[Sequence[int]]
+    ):
+        _validate_qpd_instructions(circuit, instruction_ids)
+        self._circuit = circuit
+        self._instruction_ids = [tuple(decomp_ids) for decomp_ids in instruction_ids]
+        self._local_instructions: dict[tuple[int, int], list[CircuitInstruction]] = {}
+
+    def decompose(
+        self,
+        map_ids: Sequence[int],
+        appended: Sequence[CircuitInstruction] = (),
+    ) -> QuantumCircuit:
+        """Return a decomposed copy of the circuit, with ``appended`` placed at the end."""
+        if len(self._instruction_ids) != len(map_ids):
+            raise ValueError(
+                f"The number of map IDs ({len(map_ids)}) must equal the number of "
+                f"decompositions in the circuit ({len(self._instruction_ids)})."
+            )
+        circuit = self._circuit.copy()
+        data = circuit.data
+        replacements = sorted(
+            (
+                (gate_id, self._get_local_instructions(data, gate_id, map_id))
+                for decomp_ids, map_id in zip(self._instruction_ids, map_ids)
+                for gate_id in decomp_ids
+            ),
+            reverse=True,
+        )
+        # Splice the local instructions in place of each QPD gate, working from
+        # the back of the circuit so that the remaining gate indices stay valid.
+        # Only the few QPD gates are touched; rebuilding all of the circuit's
+        # data would revalidate every instruction.
+        for gate_id, local_instructions in replacements:
+            if local_instructions:
+                data[gate_id] = local_instructions[0]
+                for offset, inst in enumerate(local_instructions[1:], start=1):
+                    data.insert(gate_id + offset, inst)
+            else:
+                del data[gate_id]
+        for inst in appended:
+            circuit.append(inst, copy=False)
+        _decompose_qpd_measurements(circuit)
+        return circuit
+
+    def _get_local_instructions(
+        self, data: Sequence[CircuitInstruction], gate_id: int, map_id: int
+    ) -> list[CircuitInstruction]:
+        """Return the local instructions which replace a QPD gate for the given map ID."""
+        key = (gate_id, map_id)
+        local_instructions = self._local_instructions.get(key)
+        if local_instructions is None:
+            inst = data[gate_id]
+            gate = inst.operation
+            if map_id not in range(len(gate.basis.maps)):
+                raise ValueError("Basis ID out of range")
+            base = gate.basis.maps[map_id]
+            if isinstance(gate, TwoQubitQPDGate):
+                qubit_ops = zip(inst.qubits, base)
+            else:
+                assert isinstance(gate, SingleQubitQPDGate)
+                qubit_ops = zip(inst.qubits, (base[gate.qubit_id],))
+            local_instructions = [
+                CircuitInstruction(op, qubits=[qubit])
+                for qubit, ops in qubit_ops
+                for op in ops
+            ]
+            self._local_instructions[key] = local_instructions
+        return local_instructions
+
+
 def _validate_qpd_instructions(
     circuit: QuantumCircuit, instruction_ids: Sequence[Sequence[int]]
 ):
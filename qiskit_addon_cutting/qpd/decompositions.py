@@ -13,7 +13,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence, Callable
+from collections.abc import Sequence, Callable, Hashable
 
 import numpy as np
 from qiskit.circuit import (
@@ -77,6 +77,34 @@ def _register_qpdbasis_from_instruction(*args):
     return g
 
 
+def _instruction_cache_key(gate: Instruction, /) -> Hashable | None:
+    """Return a key identifying the :class:`.QPDBasis` of ``gate``, or ``None`` if there is none.
+
+    Two gates with equal keys have the same decomposition, so the (possibly
+    expensive) result of :func:`qpdbasis_from_instruction` may be reused
+    between them.  Keys are only provided for Qiskit's standard gates whose
+    parameters are all real numbers, as those gates are fully described by
+    their class, width, parameters, and control state.  For any other operation
+    (e.g., a :class:`.UnitaryGate`, a :class:`.PauliEvolutionGate`, a gate with
+    unbound parameters, or a user-defined gate), ``None`` is returned.
+    """
+    # ``base_class`` sees through the classes Qiskit generates for singleton gates
+    base_class = gate.base_class
+    if not base_class.__module__.startswith("qiskit.circuit.library.standard_gates."):
+        return None
+    params = gate.params
+    if not all(isinstance(param, (int, float)) for param in params):
+        return None
+    # Some library classes (e.g., multi-controlled gates) have a variable width
+    return (
+        base_class,
+        gate.name,
+        gate.num_qubits,
+        tuple(params),
+        getattr(gate, "ctrl_state", None),
+    )
+
+
 def qpdbasis_from_instruction(gate: Instruction, /) -> QPDBasis:
     """
     Generate a :class:`.QPDBasis` object, given a supported operation.
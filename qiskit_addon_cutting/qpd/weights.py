@@ -395,10 +395,12 @@ def _populate_samples(
     if running_state not in conditional_probabilities:
         # Everything below us is sampled, so we can sample directly from the
         # remaining independent probability distributions.
+        # The samples are converted to Python ints before tallying, as
+        # hashing tuples of NumPy scalars is several times slower.
         samples_by_decomp = []
         for probs in independent_probabilities[len(running_state) :]:
             samples_by_decomp.append(
-                np.random.choice(range(len(probs)), num_desired, p=probs)
+                np.random.choice(len(probs), num_desired, p=probs).tolist()
             )
         for outcome, count in Counter(zip(*samples_by_decomp)).items():
             assert (running_state + outcome) not in random_samples
@@ -408,7 +410,7 @@ def _populate_samples(
     # There are some exact weight(s) below us, so we must consider the
     # conditional probabilities at the current level.
     probs = conditional_probabilities[running_state]
-    current_outcomes = np.random.choice(range(len(probs)), num_desired, p=probs)
+    current_outcomes = np.random.choice(len(probs), num_desired, p=probs).tolist()
     for current_outcome, count in Counter(current_outcomes).items():
         outcome = running_state + (current_outcome,)
         if len(outcome) == len(independent_probabilities):
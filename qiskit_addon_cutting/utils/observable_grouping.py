@@ -34,9 +34,6 @@ from qiskit.quantum_info import Pauli, PauliList
 from .iteration import strict_zip
 
 
-_I = Pauli("I")
-
-
 def observables_restricted_to_subsystem(
     qubits: Sequence[int], global_observables: Sequence[Pauli] | PauliList, /
 ) -> list[Pauli] | PauliList:
@@ -97,32 +94,40 @@ def most_general_observable(
         )
     if num_qubits is None:
         num_qubits = len(commuting_observables[0])
-    rv = Pauli((np.zeros(num_qubits), np.zeros(num_qubits)))
-    # TODO(perf): This is a slow Python loop within a loop, surely slower than
-    # it _could_ be, *especially* if given a PauliList.
-    #
-    # Indeed, this can be made better by using pauli.x and pauli.z arrays
-    # https://github.com/Qiskit/qiskit-terra/blob/061aee2685676271fd0860d0a2d699e36941ae5e/qiskit/primitives/backend_estimator.py#L403-L404
-    for j, obs in enumerate(commuting_observables):
-        if not isinstance(obs, Pauli):
-            raise ValueError("Input sequence includes something other than a Pauli.")
-        if len(obs) != num_qubits:
+    # Work directly with the symplectic representation: stack the ``x`` and
+    # ``z`` bits of every observable, then resolve each qubit with a single
+    # pass over the columns rather than looping over each qubit of each Pauli.
+    if isinstance(commuting_observables, PauliList):
+        if commuting_observables.num_qubits != num_qubits:
             raise ValueError(
-                f"Observable {j} has incorrect qubit count ({len(obs)} rather than "
-                f"{num_qubits})."
+                f"Observable 0 has incorrect qubit count "
+                f"({commuting_observables.num_qubits} rather than {num_qubits})."
             )
-        for i, o in enumerate(obs):
-            if o == _I:
-                continue
-            rv_i = rv[i]
-            if rv_i == o:
-                continue
-            if rv_i != _I:
+        x = commuting_observables.x
+        z = commuting_observables.z
+    else:
+        for j, obs in enumerate(commuting_observables):
+            if not isinstance(obs, Pauli):
+                raise ValueError(
+                    "Input sequence includes something other than a Pauli."
+                )
+            if len(obs) != num_qubits:
                 raise ValueError(
-                    "Observables are incompatible; cannot construct a single general observable."
+                    f"Observable {j} has incorrect qubit count ({len(obs)} rather than "
+                    f"{num_qubits})."
                 )
-            rv[i] = o
-    return rv
+        x = np.array([obs.x for obs in commuting_observables], dtype=bool)
+        z = np.array([obs.z for obs in commuting_observables], dtype=bool)
+    # Encode each single-qubit Pauli as an integer (I=0, X=1, Z=2, Y=3).  The
+    # observables are compatible iff, on each qubit, every non-identity entry
+    # matches the largest (i.e., the only non-identity) code on that qubit.
+    codes = x.astype(np.uint8) | (z.astype(np.uint8) << 1)
+    general = codes.max(axis=0, initial=0)
+    if np.any((codes != 0) & (codes != general)):
+        raise ValueError(
+            "Observables are incompatible; cannot construct a single general observable."
+        )
+    return Pauli(((general & 2).astype(bool), (general & 1).astype(bool)))
 
 
 @dataclass(frozen=True)
@@ -145,22 +150,26 @@ class CommutingObservableGroup:
 
     def __post_init__(self) -> None:
         """Post-init method for the data class."""
-        # TODO(perf): These loops could be faster; see e.g. https://github.com/Qiskit/qiskit-terra/blob/061aee2685676271fd0860d0a2d699e36941ae5e/qiskit/primitives/backend_estimator.py#L398-L413
-        pauli_indices: list[int] = [
-            i for i, pauli in enumerate(self.general_observable) if pauli != _I
-        ]
-        pauli_bitmasks: list[int] = []
         for pauli in self.commuting_observables:
             if pauli.phase != 0:
                 raise ValueError(
                     "CommutingObservableGroup only supports Paulis with phase == 0. "
                     f"(Value provided: {pauli.phase})"
                 )
-            v = 0
-            for i, j in enumerate(pauli_indices):
-                if pauli[j] != _I:
-                    v |= 1 << i
-            pauli_bitmasks.append(v)
+        general_observable = self.general_observable
+        pauli_indices: list[int] = np.flatnonzero(
+            general_observable.x | general_observable.z
+        ).tolist()
+        # Pack, for each observable, whether it acts on each of the qubits in
+        # pauli_indices into the bits of an integer (little-endian, so that bit
+        # ``i`` corresponds to ``pauli_indices[i]``).
+        support = np.array(
+            [pauli.x | pauli.z for pauli in self.commuting_observables], dtype=bool
+        ).reshape(len(self.commuting_observables), general_observable.num_qubits)
+        packed = np.packbits(support[:, pauli_indices], axis=1, bitorder="little")
+        pauli_bitmasks: list[int] = [
+            int.from_bytes(row.tobytes(), "little") for row in packed
+        ]
 
         # https://docs.python.org/3/library/dataclasses.html#frozen-instances
         # says "when using frozen=True: __init__() cannot use simple assignment
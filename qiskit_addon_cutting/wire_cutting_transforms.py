@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 from typing import Callable
-from itertools import groupby
+from collections import Counter
 
 import numpy as np
 from qiskit.circuit import Qubit, QuantumCircuit, Operation
@@ -62,23 +62,28 @@ def _transform_cut_wires(
     circuit: QuantumCircuit, factory: Callable[[], Operation], /
 ) -> QuantumCircuit:
     new_circuit, mapping = _circuit_structure_mapping(circuit)
+    bit_index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    new_qubits = new_circuit.qubits
 
     for instructions in circuit.data:
-        gate_index = [circuit.find_bit(qubit).index for qubit in instructions.qubits]
+        gate_index = [bit_index[qubit] for qubit in instructions.qubits]
 
-        if instructions in circuit.get_instructions("cut_wire"):
+        if instructions.operation.name == "cut_wire":
             # Replace cut_wire with move instruction
-            new_circuit.compose(
-                other=factory(),
-                qubits=[mapping[gate_index[0]], mapping[gate_index[0]] + 1],
-                inplace=True,
+            new_circuit.append(
+                factory(),
+                [
+                    new_qubits[mapping[gate_index[0]]],
+                    new_qubits[mapping[gate_index[0]] + 1],
+                ],
+                copy=False,
             )
             mapping[gate_index[0]] += 1
         else:
-            new_circuit.compose(
-                other=instructions.operation,
-                qubits=[mapping[index] for index in gate_index],
-                inplace=True,
+            new_circuit.append(
+                instructions.operation,
+                [new_qubits[mapping[index]] for index in gate_index],
+                instructions.clbits,
             )
 
     return new_circuit
@@ -88,23 +93,21 @@ def _circuit_structure_mapping(
     circuit: QuantumCircuit,
 ) -> tuple[QuantumCircuit, list[int]]:
     new_circuit = QuantumCircuit()
-    mapping = list(range(len(circuit.qubits)))
+    mapping = np.arange(len(circuit.qubits))
+    bit_index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
 
     cut_wire_index = [
-        circuit.find_bit(instruction.qubits[0]).index
+        bit_index[instruction.qubits[0]]
         for instruction in circuit.get_instructions("cut_wire")
     ]
-    cut_wire_freq = {key: len(list(group)) for key, group in groupby(cut_wire_index)}
+    cut_wire_freq = Counter(cut_wire_index)
 
     # Get intermediate mapping and add quantum bits to new_circuit
-    for qubit in circuit.qubits:
-        index = circuit.find_bit(qubit).index
-        if index in cut_wire_freq.keys():
-            for _ in range(cut_wire_freq[index]):
-                mapping[index + 1 :] = map(
-                    lambda item: item + 1, iter(mapping[index + 1 :])
-                )
-                new_circuit.add_bits([Qubit()])
+    for index, qubit in enumerate(circuit.qubits):
+        if index in cut_wire_freq:
+            # Each cut on this wire shifts all later wires over by one qubit
+            mapping[index + 1 :] += cut_wire_freq[index]
+            new_circuit.add_bits([Qubit() for _ in range(cut_wire_freq[index])])
         new_circuit.add_bits([qubit])
 
     # Add quantum and classical registers
@@ -115,7 +118,7 @@ def _circuit_structure_mapping(
     for creg in circuit.cregs:
         new_circuit.add_register(creg)
 
-    return new_circuit, mapping
+    return new_circuit, mapping.tolist()
 
 
 def expand_observables(
@@ -26,8 +26,11 @@ from qiskit_addon_cutting.cut_finding.cut_optimization import (
     cut_optimization_cost_func,
     cut_optimization_goal_state_func,
     cut_optimization_upper_bound_cost_func,
+    cut_optimization_upper_bound_cost_func_batch,
     CutOptimizationFuncArgs,
     CutOptimization,
+    greedy_cut_optimization,
+    make_cut_optimization_func_args,
 )
 from qiskit_addon_cutting.cut_finding.optimization_settings import (
     OptimizationSettings,
@@ -42,6 +45,7 @@ from qiskit_addon_cutting.cut_finding.cutting_actions import (
 )
 
 from qiskit_addon_cutting.cut_finding.best_first_search import (
+    BestFirstPriorityQueue,
     BestFirstSearch,
     SearchFunctions,
 )
@@ -204,3 +208,90 @@ def test_best_first_search_termination():
     # After these 5 possible cuts are returned, at the 6th iteration, None
     # is returned for both the state and the cost.
     assert counter == 6 and cut_cost is None
+
+
+def test_upper_bound_cost_func_batch(test_circuit: SimpleGateList):
+    """Test that the batched cost function agrees with the per-state cost function and prunes against the bound."""
+    func_args = CutOptimizationFuncArgs()
+    func_args.entangling_gates = test_circuit.get_multiqubit_gates()
+    func_args.search_actions = disjoint_subcircuit_actions
+    func_args.max_gamma = 1024
+    func_args.qpu_width = 4
+
+    state = DisjointSubcircuitsState(test_circuit.get_num_qubits(), 2)
+    state.level = 0
+    next_states = cut_optimization_next_state_func(state, func_args)
+    costs = [
+        cut_optimization_upper_bound_cost_func(next_state, func_args)
+        for next_state in next_states
+    ]
+    assert sorted(costs) == [(1, inf), (3, inf), (4, inf), (4, inf), (16, inf)]
+
+    assert (
+        cut_optimization_upper_bound_cost_func_batch(next_states, None, func_args)
+        == costs
+    )
+    assert cut_optimization_upper_bound_cost_func_batch(
+        next_states, (3, inf), func_args
+    ) == [cost if cost <= (3, inf) else None for cost in costs]
+    assert cut_optimization_upper_bound_cost_func_batch(
+        next_states, (3, 4), func_args
+    ) == [cost if cost <= (3, 4) else None for cost in costs]
+
+
+def test_best_first_priority_queue():
+    """Test that states come off the queue by cost, then deepest first, with tuple costs compared lexicographically."""
+    pqueue = BestFirstPriorityQueue(seed=0)
+    states = [DisjointSubcircuitsState() for _ in range(5)]
+
+    pqueue.put(states[0], 1, (3.0, inf))
+    pqueue.put(states[1], 2, (3.0, inf))
+    pqueue.put(states[2], 5, (4.0, inf))
+    pqueue.put(states[3], 0, (1.0, inf))
+    pqueue.put(states[4], 3, (3.0, 2))
+
+    assert pqueue.qsize() == 5
+    assert pqueue.get() == (states[3], 0, (1.0, inf))
+    assert pqueue.get() == (states[4], 3, (3.0, 2))
+    assert pqueue.get() == (states[1], 2, (3.0, inf))
+    assert pqueue.get() == (states[0], 1, (3.0, inf))
+    assert pqueue.get() == (states[2], 5, (4.0, inf))
+    assert pqueue.qsize() == 0
+
+    pqueue.put(states[0], 1, (3.0, inf))
+    pqueue.clear()
+    assert pqueue.qsize() == 0
+
+
+def test_greedy_cut_optimization_func_args(test_circuit: SimpleGateList):
+    """Test that the greedy pass builds the same func_args it would be given."""
+    settings = OptimizationSettings(seed=12345)
+    constraint_obj = DeviceConstraints(qubits_per_subcircuit=4)
+
+    func_args = make_cut_optimization_func_args(
+        test_circuit, settings, constraint_obj, disjoint_subcircuit_actions
+    )
+    given = greedy_cut_optimization(
+        test_circuit, settings, constraint_obj, func_args=func_args
+    )
+    built = greedy_cut_optimization(test_circuit, settings, constraint_obj)
+
+    assert given is not None and built is not None
+    assert built.upper_bound_gamma() == given.upper_bound_gamma() == 27
+    assert get_actions_list(built.actions) == get_actions_list(given.actions)
+
+
+def test_best_first_priority_queue_put_batch():
+    """Test that pushing states in batches gives the same order as pushing them one at a time."""
+    single = BestFirstPriorityQueue(seed=7)
+    batched = BestFirstPriorityQueue(seed=7)
+    states = [DisjointSubcircuitsState() for _ in range(41)]
+
+    for depth, batch in enumerate([states[:1], states[1:5], states[5:40], states[40:]]):
+        costs = [(float(i % 3), inf) for i in range(len(batch))]
+        for state, cost in zip(batch, costs):
+            single.put(state, depth, cost)
+        batched.put_batch(batch, depth, costs)
+
+    assert batched.qsize() == single.qsize() == 41
+    assert [batched.get() for _ in range(41)] == [single.get() for _ in range(41)]
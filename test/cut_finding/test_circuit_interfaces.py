@@ -17,6 +17,7 @@ from qiskit_addon_cutting.cut_finding.circuit_interface import (
     CircuitElement,
     SimpleGateList,
     GateSpec,
+    NameToIDMap,
 )
 
 from qiskit_addon_cutting.cut_finding.cut_optimization import (
@@ -55,27 +56,35 @@ class TestCircuitInterface:
                 cut_constraints=None,
             )
         ]
+        assert circuit_converted.get_num_multiqubit_inputs() == 2
 
         assert circuit_converted.circuit == [
-            [CircuitElement(name="h", params=[], qubits=[0], gamma=None), None],
-            [CircuitElement(name="barrier", params=[], qubits=[0], gamma=None), None],
-            [CircuitElement(name="s", params=[], qubits=[1], gamma=None), None],
-            ["barrier", None],
-            [CircuitElement(name="cx", params=[], qubits=[0, 1], gamma=3), None],
+            (CircuitElement(name="h", params=[], qubits=[0], gamma=None), None),
+            (CircuitElement(name="barrier", params=[], qubits=[0], gamma=None), None),
+            (CircuitElement(name="s", params=[], qubits=[1], gamma=None), None),
+            ("barrier", None),
+            (CircuitElement(name="cx", params=[], qubits=[0, 1], gamma=3), None),
         ]
 
+        # Without cuts, all wires belong to a single subcircuit.
+        assert circuit_converted.subcircuits == [[0, 1]]
+        assert circuit_converted.export_subcircuits_as_string() == "AA"
+
         assert max_wire_cuts_circuit(circuit_converted) == 2
         assert max_wire_cuts_gamma(7) == 2
+        assert max_wire_cuts_gamma(1) == 0
+        assert max_wire_cuts_gamma(7.5) == 3
+        assert max_wire_cuts_gamma(2**53 + 1) == 53
 
         # Assign by hand a different qubit mapping by specifiying init_qubit_names.
         circuit_converted = SimpleGateList(trial_circuit, ["q0", "q1"])
         assert circuit_converted.qubit_names.item_dict == {"q0": 0, "q1": 1}
         assert circuit_converted.circuit == [
-            [CircuitElement(name="h", params=[], qubits=[1], gamma=None), None],
-            [CircuitElement(name="barrier", params=[], qubits=[1], gamma=None), None],
-            [CircuitElement(name="s", params=[], qubits=[0], gamma=None), None],
-            ["barrier", None],
-            [CircuitElement(name="cx", params=[], qubits=[1, 0], gamma=3), None],
+            (CircuitElement(name="h", params=[], qubits=[1], gamma=None), None),
+            (CircuitElement(name="barrier", params=[], qubits=[1], gamma=None), None),
+            (CircuitElement(name="s", params=[], qubits=[0], gamma=None), None),
+            ("barrier", None),
+            (CircuitElement(name="cx", params=[], qubits=[1, 0], gamma=3), None),
         ]
 
     def test_gate_cut_interface(self):
@@ -93,7 +102,7 @@ class TestCircuitInterface:
         circuit_converted.define_subcircuits([[0, 1], [2, 3]])
 
         assert list(circuit_converted.new_gate_id_map) == [0, 1, 2, 3, 4]
-        assert circuit_converted.cut_type == [None, None, "LO", None, None]
+        assert list(circuit_converted.cut_type) == [None, None, "LO", None, None]
         assert (
             circuit_converted.export_subcircuits_as_string(name_mapping="default")
             == "AABB"
@@ -167,3 +176,15 @@ class TestCircuitInterface:
             CircuitElement(name="cx", params=[], qubits=[0, 2], gamma=3),
             CircuitElement(name="cx", params=[], qubits=[3, 4], gamma=3),
         ]
+
+
+def test_name_to_id_map():
+    """Test that IDs assigned with ``define_id`` are skipped by ``get_id``."""
+    names = NameToIDMap(["a"])
+    names.define_id(1, "b")
+    assert names.get_id("c") == 2
+    assert names.get_id("a") == 0
+    assert names.get_name(1) == "b"
+    assert names.get_name(3) is None
+    assert names.get_array_size_needed() == 3
+    assert list(names.get_ids()) == [0, 1, 2]
@@ -37,6 +37,7 @@ from qiskit_addon_cutting.cut_finding.lo_cuts_optimizer import (
     LOCutsOptimizer,
 )
 from qiskit_addon_cutting.cut_finding.cut_optimization import CutOptimization
+from qiskit_addon_cutting.cut_finding.best_first_search import SearchStats
 
 
 class TestCuttingFourQubitCircuit(unittest.TestCase):
@@ -69,6 +70,22 @@ class TestCuttingFourQubitCircuit(unittest.TestCase):
                 interface.export_subcircuits_as_string(name_mapping="default") == "AAAA"
             )
 
+            # The greedy solution needs no cuts, so no search is performed.
+            assert optimization_pass.minimum_reached() is True
+            assert optimization_pass.get_stats()["CutOptimization"] == SearchStats(
+                states_visited=0,
+                next_states_generated=0,
+                states_enqueued=0,
+                backjumps=0,
+            )
+
+            cut_opt = CutOptimization(interface, settings, constraint_obj)
+            assert cut_opt.get_upperbound_cost() == (1.0, np.inf)
+            cut_opt.update_upperbound_cost((2, 4))
+            assert cut_opt.get_upperbound_cost() == (1.0, np.inf)
+            cut_opt.update_upperbound_cost((1.0, 4))
+            assert cut_opt.get_upperbound_cost() == (1.0, 4)
+
         with self.subTest("No cuts found when all flags set to False"):
 
             qubits_per_subcircuit = 3
@@ -158,6 +175,31 @@ class TestCuttingFourQubitCircuit(unittest.TestCase):
                 interface.export_subcircuits_as_string(name_mapping="default") == "AAAB"
             )  # circuit separated into 2 subcircuits.
 
+        with self.subTest("Gate cuts without the greedy warm start"):
+            # max_gamma alone bounds the search, and the same optimum is found.
+            qubits_per_subcircuit = 3
+
+            interface = SimpleGateList(self.circuit_internal)
+
+            settings = OptimizationSettings(
+                seed=12345, gate_lo=True, wire_lo=True, skip_greedy_if_bounded=True
+            )
+
+            constraint_obj = DeviceConstraints(qubits_per_subcircuit)
+
+            cut_opt = CutOptimization(interface, settings, constraint_obj)
+            assert cut_opt.greedy_goal_state is None
+
+            optimization_pass = LOCutsOptimizer(interface, settings, constraint_obj)
+
+            output = optimization_pass.optimize()
+
+            assert output.upper_bound_gamma() == 9
+            assert optimization_pass.minimum_reached() is True
+            assert (
+                interface.export_subcircuits_as_string(name_mapping="default") == "AAAB"
+            )
+
         with self.subTest("Gate cuts to get two qubits per subcircuit"):
 
             qubits_per_subcircuit = 2
@@ -160,6 +160,20 @@ def test_cut_right_wire(
         assert action.args[0][0] == 2  # the second input ('right') wire is cut
 
 
+def test_wire_cut_limit(
+    test_circuit: Callable[
+        [],
+        tuple[SimpleGateList, DisjointSubcircuitsState, GateSpec],
+    ]
+):
+    """Test that single wire cuts are not made once the wire-cut limit is reached."""
+    interface, _, two_qubit_gate = test_circuit
+    state = DisjointSubcircuitsState(interface.get_num_qubits(), 0)
+
+    assert ActionCutLeftWire().next_state_primitive(state, two_qubit_gate, 3) == []
+    assert ActionCutRightWire().next_state_primitive(state, two_qubit_gate, 3) == []
+
+
 def test_defined_actions():
     """Check that unsupported cutting actions return None"""
 
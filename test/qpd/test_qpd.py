@@ -20,7 +20,12 @@ import pytest
 import numpy as np
 import numpy.typing as npt
 from ddt import ddt, data, unpack
-from qiskit.circuit import QuantumCircuit, ClassicalRegister, CircuitInstruction
+from qiskit.circuit import (
+    QuantumCircuit,
+    ClassicalRegister,
+    CircuitInstruction,
+    Parameter,
+)
 from qiskit.circuit.library import (
     EfficientSU2,
     CXGate,
@@ -44,7 +49,12 @@ from qiskit.circuit.library import (
     SwapGate,
     iSwapGate,
     DCXGate,
+    UnitaryGate,
+    MSGate,
+    MCPhaseGate,
+    PauliEvolutionGate,
 )
+from qiskit.quantum_info import SparsePauliOp
 
 from qiskit_addon_cutting.utils.iteration import unique_by_eq, strict_zip
 from qiskit_addon_cutting.instructions import Move
@@ -57,11 +67,13 @@ from qiskit_addon_cutting.qpd import (
     decompose_qpd_instructions,
     qpdbasis_from_instruction,
 )
+from qiskit_addon_cutting.qpd.decompose import _QPDDecomposer
 from qiskit_addon_cutting.qpd.weights import (
     _generate_qpd_weights,
     _generate_exact_weights_and_conditional_probabilities,
 )
 from qiskit_addon_cutting.qpd.decompositions import (
+    _instruction_cache_key,
     _nonlocal_qpd_basis_from_u,
     _u_from_thetavec,
     _explicitly_supported_instructions,
@@ -263,6 +275,65 @@ class TestQPDFunctions(unittest.TestCase):
                 == "The total number of QPDGates specified in instruction_ids (2) does not equal the number of QPDGates in the circuit (3)."
             )
 
+    def test_qpd_decomposer(self):
+        decomp = QPDBasis.from_instruction(RXXGate(np.pi / 3))
+        qc = QuantumCircuit(3)
+        qc.append(CircuitInstruction(TwoQubitQPDGate(basis=decomp), qubits=[0, 1]))
+        qc.x([0, 1, 2])
+        qc.append(CircuitInstruction(SingleQubitQPDGate(decomp, 0), qubits=[1]))
+        qc.y(0)
+        qc.append(CircuitInstruction(SingleQubitQPDGate(decomp, 1), qubits=[2]))
+        instruction_ids = [[4, 6], [0]]
+        decomposer = _QPDDecomposer(qc, instruction_ids)
+        for map_ids in itertools.product(range(len(decomp.maps)), repeat=2):
+            with self.subTest(map_ids=map_ids):
+                self.assertEqual(
+                    decomposer.decompose(map_ids),
+                    decompose_qpd_instructions(qc, instruction_ids, map_ids),
+                )
+        # The original circuit must be left untouched
+        self.assertIsNone(qc.data[0].operation.basis_id)
+        with self.subTest("Incorrect map index size"):
+            with pytest.raises(ValueError) as e_info:
+                decomposer.decompose([0])
+            assert (
+                e_info.value.args[0]
+                == "The number of map IDs (1) must equal the number of decompositions in the circuit (2)."
+            )
+        with self.subTest("Map index out of range"):
+            with pytest.raises(ValueError) as e_info:
+                decomposer.decompose([0, len(decomp.maps)])
+            assert e_info.value.args[0] == "Basis ID out of range"
+
+    def test_instruction_cache_key(self):
+        assert _instruction_cache_key(CXGate()) == _instruction_cache_key(CXGate())
+        assert _instruction_cache_key(RZZGate(0.5)) == _instruction_cache_key(
+            RZZGate(0.5)
+        )
+        assert _instruction_cache_key(RZZGate(0.5)) != _instruction_cache_key(
+            RZZGate(0.25)
+        )
+        assert _instruction_cache_key(RZZGate(0.5)) != _instruction_cache_key(
+            RXXGate(0.5)
+        )
+        assert _instruction_cache_key(CXGate()) != _instruction_cache_key(
+            CXGate(ctrl_state=0)
+        )
+        assert _instruction_cache_key(MCPhaseGate(0.5, 1)) != _instruction_cache_key(
+            MCPhaseGate(0.5, 2)
+        )
+        # Gates outside the standard library may hold state beyond ``params``
+        assert _instruction_cache_key(MSGate(2, 0.5)) is None
+        assert (
+            _instruction_cache_key(PauliEvolutionGate(SparsePauliOp("XX"), 0.5)) is None
+        )
+        assert (
+            _instruction_cache_key(PauliEvolutionGate(SparsePauliOp("ZZ"), 0.5)) is None
+        )
+        assert _instruction_cache_key(RZZGate(Parameter("θ"))) is None
+        assert _instruction_cache_key(UnitaryGate(np.eye(4))) is None
+        assert _instruction_cache_key(Move()) is None
+
     # Optimal values from https://arxiv.org/abs/2205.00016v2 Corollary 4.4 (page 10)
     @data(
         (CXGate(), 3),
@@ -276,6 +276,25 @@ class TestCuttingDecomposition(unittest.TestCase):
                 == "Circuits input to cut_gates should contain no classical registers or bits."
             )
 
+        with self.subTest("repeated gates"):
+            qc = QuantumCircuit(2)
+            qc.cu(0.1, 0.2, 0.3, 0.4, 0, 1)
+            qc.cu(0.1, 0.2, 0.3, 0.4, 0, 1)
+            qc.cu(0.1, 0.2, 0.3, 0.5, 0, 1)
+            qpd_qc, bases = cut_gates(qc, [0, 1, 2])
+            for inst, basis in zip(qpd_qc.data, bases):
+                assert inst.operation.basis is basis
+            # Identical gates share a decomposition, but not a basis instance
+            assert bases[0] == bases[1]
+            assert bases[0] is not bases[1]
+            assert bases[0] != bases[2]
+            for inst, gate in zip(qpd_qc.data, qc.data):
+                assert inst.operation == TwoQubitQPDGate.from_instruction(
+                    gate.operation
+                )
+            bases[0].coeffs = [1.0] * len(bases[0].coeffs)
+            assert bases[0] != bases[1]
+
     def test_unused_qubits(self):
         """Issue #218"""
         qc = QuantumCircuit(2)
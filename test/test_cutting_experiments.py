@@ -22,8 +22,13 @@ from qiskit_addon_cutting.qpd import (
     SingleQubitQPDGate,
     TwoQubitQPDGate,
     QPDBasis,
+    decompose_qpd_instructions,
+    generate_qpd_weights,
+)
+from qiskit_addon_cutting.utils.observable_grouping import (
+    CommutingObservableGroup,
+    ObservableCollection,
 )
-from qiskit_addon_cutting.utils.observable_grouping import CommutingObservableGroup
 from qiskit_addon_cutting import generate_cutting_experiments
 from qiskit_addon_cutting.qpd import WeightType
 from qiskit_addon_cutting import partition_problem
@@ -33,6 +38,7 @@ from qiskit_addon_cutting.cutting_experiments import (
     _remove_final_resets,
     _consolidate_resets,
     _remove_resets_in_zero_state,
+    _sampled_coefficients,
 )
 
 
@@ -60,6 +66,22 @@ class TestCuttingExperiments(unittest.TestCase):
             for exp in subexperiments:
                 assert isinstance(exp, QuantumCircuit)
 
+        with self.subTest("unseparated circuit with uncut gates"):
+            qc = QuantumCircuit(2)
+            qc.h(0)
+            qc.append(
+                TwoQubitQPDGate(QPDBasis.from_instruction(CXGate()), label="cut_cx"),
+                qargs=[0, 1],
+            )
+            qc.h(1)
+            subexperiments, coeffs = generate_cutting_experiments(
+                qc, PauliList(["ZZ"]), np.inf
+            )
+            assert coeffs == comp_coeffs
+            assert len(coeffs) == len(subexperiments)
+            for exp in subexperiments:
+                assert exp.data[0].operation.name == "h"
+
         with self.subTest("simple circuit and observable as dict"):
             qc = QuantumCircuit(2)
             qc.append(
@@ -137,6 +159,39 @@ class TestCuttingExperiments(unittest.TestCase):
                 ' formatted as "<your_label>_N". This allows SingleQubitQPDGates '
                 "belonging to the same cut to be sampled jointly."
             )
+        with self.subTest("test missing cut id"):
+            qc = QuantumCircuit(2)
+            qc.append(
+                TwoQubitQPDGate(QPDBasis.from_instruction(CXGate()), label="cut_cx"),
+                qargs=[0, 1],
+            )
+            partitioned_problem = partition_problem(
+                qc, "AB", observables=PauliList(["ZZ"])
+            )
+            for subcircuit in partitioned_problem.subcircuits.values():
+                subcircuit.data[0].operation.label = "cut_cx_1"
+            with pytest.raises(ValueError) as e_info:
+                generate_cutting_experiments(
+                    partitioned_problem.subcircuits,
+                    partitioned_problem.subobservables,
+                    np.inf,
+                )
+            assert e_info.value.args[0] == (
+                "The cut ids suffixed to the SingleQubitQPDGate labels must be the "
+                "integers 0 through 1, but no gate has cut id (0)."
+            )
+            for subcircuit in partitioned_problem.subcircuits.values():
+                subcircuit.data[0].operation.label = "cut_cx_-1"
+            with pytest.raises(ValueError) as e_info:
+                generate_cutting_experiments(
+                    partitioned_problem.subcircuits,
+                    partitioned_problem.subobservables,
+                    np.inf,
+                )
+            assert (
+                e_info.value.args[0]
+                == "Cut ids must be nonnegative, but found cut id (-1)."
+            )
         with self.subTest("test bad observable size"):
             qc = QuantumCircuit(4)
             with pytest.raises(ValueError) as e_info:
@@ -160,6 +215,106 @@ class TestCuttingExperiments(unittest.TestCase):
                 == "SingleQubitQPDGates are not supported in unseparable circuits."
             )
 
+    def test_generate_cutting_experiments_repeated_subexperiments(self):
+        # With three partitions, each outer subcircuit is touched by only one
+        # of the two cuts, so many samples share its map ids.
+        qc = QuantumCircuit(3)
+        qc.ry(0.4, [0, 1, 2])
+        qc.cx(0, 1)
+        qc.cx(1, 2)
+        qc.rx(0.3, [0, 1, 2])
+        partitioned_problem = partition_problem(
+            qc, "ABC", observables=PauliList(["ZZZ", "XYZ"])
+        )
+        subcircuits = partitioned_problem.subcircuits
+        subobservables = partitioned_problem.subobservables
+        bases = partitioned_problem.bases
+        subexperiments, coefficients = generate_cutting_experiments(
+            subcircuits, subobservables, np.inf
+        )
+
+        # Build every subexperiment from scratch, without reusing any of them.
+        samples = sorted(
+            generate_qpd_weights(bases, np.inf).items(),
+            key=lambda x: x[1][0],
+            reverse=True,
+        )
+        total_weight = sum(weight for _, (weight, _) in samples)
+        kappa = np.prod([basis.kappa for basis in bases])
+        expected_coefficients = [
+            (
+                weight
+                / total_weight
+                * kappa
+                * np.prod(np.sign([b.coeffs[i] for b, i in zip(bases, map_ids)])),
+                weight_type,
+            )
+            for map_ids, (weight, weight_type) in samples
+        ]
+        assert np.allclose(
+            [c for c, _ in coefficients], [c for c, _ in expected_coefficients]
+        )
+        assert [w for _, w in coefficients] == [w for _, w in expected_coefficients]
+
+        for label, subcircuit in subcircuits.items():
+            qpd_gate_ids = [
+                i
+                for i, inst in enumerate(subcircuit.data)
+                if isinstance(inst.operation, SingleQubitQPDGate)
+            ]
+            cut_ids = [
+                int(subcircuit.data[i].operation.label.rpartition("_")[2])
+                for i in qpd_gate_ids
+            ]
+            groups = ObservableCollection(subobservables[label]).groups
+            expected = []
+            for map_ids, _ in samples:
+                for cog in groups:
+                    subexperiment = decompose_qpd_instructions(
+                        _append_measurement_circuit(
+                            _append_measurement_register(subcircuit, cog), cog
+                        ),
+                        [[i] for i in qpd_gate_ids],
+                        [map_ids[cut_id] for cut_id in cut_ids],
+                    )
+                    _remove_resets_in_zero_state(subexperiment)
+                    _remove_final_resets(subexperiment)
+                    _consolidate_resets(subexperiment)
+                    expected.append(subexperiment)
+            assert subexperiments[label] == expected
+            # Repeated subexperiments are independent copies, not aliases.
+            assert len({id(c) for c in subexperiments[label]}) == len(expected)
+
+        # The outer subcircuits do repeat, so the test exercises their reuse.
+        assert len(subexperiments["A"]) == len(samples)
+        assert len({str(c.data) for c in subexperiments["A"]}) < len(samples)
+
+    def test_sampled_coefficients(self):
+        basis = QPDBasis.from_instruction(CXGate())
+        bases = [basis, basis]
+        samples = [
+            ((0, 0), (3, WeightType.EXACT)),
+            ((0, 4), (2, WeightType.EXACT)),
+            ((5, 5), (1, WeightType.SAMPLED)),
+        ]
+        kappa = basis.kappa**2
+        expected = [
+            (redundancy / 6)
+            * kappa
+            * np.sign(basis.coeffs[map_ids[0]] * basis.coeffs[map_ids[1]])
+            for map_ids, (redundancy, _) in samples
+        ]
+        map_ids_matrix = np.array([map_ids for map_ids, _ in samples])
+        redundancies = [redundancy for _, (redundancy, _) in samples]
+        assert np.allclose(
+            _sampled_coefficients(bases, map_ids_matrix, redundancies, kappa, 6),
+            expected,
+        )
+        with self.subTest("No bases"):
+            assert list(
+                _sampled_coefficients([], np.empty((1, 0), dtype=int), [1], 1.0, 1)
+            ) == [1.0]
+
     def test_append_measurement_register(self):
         qc = QuantumCircuit(2)
         qc.h(0)
@@ -10,6 +10,7 @@
 # that they have been altered from the originals.
 
 import unittest
+import warnings
 from ddt import ddt, data, unpack
 
 import pytest
@@ -28,6 +29,9 @@ from qiskit_addon_cutting.utils.observable_grouping import CommutingObservableGr
 from qiskit_addon_cutting.qpd import WeightType
 from qiskit_addon_cutting.cutting_reconstruction import (
     _process_outcome,
+    _process_outcome_v2,
+    _process_outcomes_v2,
+    _process_quasi_dist,
     reconstruct_expectation_values,
 )
 
@@ -168,3 +172,47 @@ class TestCuttingReconstruction(unittest.TestCase):
             hex(int(f"0b{outcome}", 0)),
         ):
             assert np.all(_process_outcome(self.cog, o) == expected)
+
+    def test_process_outcomes_v2(self):
+        rng = np.random.default_rng(seed=2)
+        # Span more than one byte in each register
+        cog = CommutingObservableGroup(
+            Pauli("XZ" * 6),
+            [Pauli("IZ" * 6), Pauli("XI" * 6), Pauli("XZIIIIIIIIXZ")],
+        )
+        obs_array = rng.integers(0, 256, size=(50, 2), dtype=np.uint8)
+        obs_array[:, 0] &= 0x0F
+        qpd_array = rng.integers(0, 256, size=(50, 2), dtype=np.uint8)
+        expected = np.mean(
+            [
+                _process_outcome_v2(
+                    cog, int.from_bytes(obs, "big"), int.from_bytes(qpd, "big")
+                )
+                for obs, qpd in zip(obs_array, qpd_array)
+            ],
+            axis=0,
+        )
+        assert np.allclose(_process_outcomes_v2(cog, obs_array, qpd_array), expected)
+        with self.subTest("No shots"):
+            empty = np.empty((0, 2), dtype=np.uint8)
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                assert np.all(_process_outcomes_v2(cog, empty, empty) == np.zeros(3))
+
+    def test_process_quasi_dist(self):
+        rng = np.random.default_rng(seed=3)
+        # Span more than one byte in each register
+        cog = CommutingObservableGroup(
+            Pauli("XZ" * 6),
+            [Pauli("IZ" * 6), Pauli("XI" * 6), Pauli("XZIIIIIIIIXZ")],
+        )
+        outcomes = rng.integers(0, 1 << 30, size=50).tolist()
+        quasi_dist = dict(zip(outcomes, rng.normal(size=50).tolist()))
+        # Mix in string keys, which _process_outcome also accepts
+        quasi_dist[bin(outcomes[0] + 1)] = 0.25
+        expected = sum(
+            quasi_prob * _process_outcome(cog, outcome)
+            for outcome, quasi_prob in quasi_dist.items()
+        )
+        assert np.allclose(_process_quasi_dist(cog, quasi_dist), expected)
+        assert np.all(_process_quasi_dist(cog, {}) == np.zeros(3))
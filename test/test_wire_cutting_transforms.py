@@ -328,6 +328,12 @@ def test_creg(request, sample_circuit):
         assert sample_creg.size == final_creg.size
 
 
+def test_cut_wire_definition():
+    definition = CutWire().definition
+    assert definition.num_qubits == 1
+    assert len(definition.data) == 0
+
+
 def test_cut_wires():
     qc = QuantumCircuit(2)
     qc.h(0)
@@ -341,6 +347,30 @@ def test_cut_wires():
     assert qpd_gate.label == "cut_move"
 
 
+def test_cut_wires_preserves_clbits():
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.append(CutWire(), [0])
+    qc.cx(0, 1)
+    qc.measure(1, 1)
+    qc.measure(0, 0)
+    qc_out = cut_wires(qc)
+    assert [qc_out.find_bit(clbit).index for clbit in qc_out.data[3].clbits] == [1]
+    assert [qc_out.find_bit(clbit).index for clbit in qc_out.data[4].clbits] == [0]
+
+
+def test_cut_wires_interleaved_cuts():
+    qc = QuantumCircuit(2)
+    qc.append(CutWire(), [0])
+    qc.append(CutWire(), [1])
+    qc.append(CutWire(), [0])
+    qc_out = _transform_cuts_to_moves(qc)
+    assert qc_out.num_qubits == 5
+    assert [
+        [qc_out.find_bit(qubit).index for qubit in inst.qubits] for inst in qc_out.data
+    ] == [[0, 1], [3, 4], [1, 2]]
+
+
 class TestExpandObservables:
     def test_expand_observables(self):
         qc0 = QuantumCircuit(3)